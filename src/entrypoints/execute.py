@@ -2,6 +2,7 @@ import asyncio
 import logging
 from asyncio import new_event_loop
 from datetime import datetime
+from uuid import UUID
 
 import pytz
 import typer
@@ -54,6 +55,12 @@ def send_messages():
             use_sso=settings.USE_SSO,
             bot_token=settings.TELEGRAM_BOT_TOKEN,
             billing_group_chat_id=settings.BILLING_MESSAGES_TELEGRAM_ID,
+            telegram_config=settings.TELEGRAM_CONFIG,
+            celery_broker_url=settings.CELERY_BROKER_URL,
+            notify_chunk_size=settings.NOTIFY_CHUNK_SIZE,
+            notify_checkpoint_size=settings.NOTIFY_CHECKPOINT_SIZE,
+            notify_retry_config=settings.NOTIFY_RETRY_CONFIG,
+            notify_upload_max_size=settings.NOTIFY_UPLOAD_MAX_SIZE,
         )
     )
     loop.run_until_complete(
@@ -61,6 +68,60 @@ def send_messages():
             created_since_from=created_since_from, created_since_to=created_since_to
         )
     )
+    loop.run_until_complete(service.close())
+
+
+@app.command(name="resume_notify")
+def resume_notify(notify_uuid: str):
+    service = loop.run_until_complete(
+        NotifyService.create_service(
+            my_sql_connection_pool=db_my_sql_pool,
+            mongo_db_connection=mongo_db_connection,
+            static_dir_path=settings.STATIC_DIR,
+            turbo_sms_config=settings.TURBO_SMS_CONFIG,
+            sender=settings.SMS_SENDER,
+            use_sso=settings.USE_SSO,
+            bot_token=settings.TELEGRAM_BOT_TOKEN,
+            billing_group_chat_id=settings.BILLING_MESSAGES_TELEGRAM_ID,
+            telegram_config=settings.TELEGRAM_CONFIG,
+            celery_broker_url=settings.CELERY_BROKER_URL,
+            notify_chunk_size=settings.NOTIFY_CHUNK_SIZE,
+            notify_checkpoint_size=settings.NOTIFY_CHECKPOINT_SIZE,
+            notify_retry_config=settings.NOTIFY_RETRY_CONFIG,
+            notify_upload_max_size=settings.NOTIFY_UPLOAD_MAX_SIZE,
+        )
+    )
+    loop.run_until_complete(service.resume_notify(notify_uuid=UUID(notify_uuid)))
+    loop.run_until_complete(service.close())
+
+
+@app.command(name="replay_dead_letters")
+def replay_dead_letters(notify_uuid: str | None = None):
+    service = loop.run_until_complete(
+        NotifyService.create_service(
+            my_sql_connection_pool=db_my_sql_pool,
+            mongo_db_connection=mongo_db_connection,
+            static_dir_path=settings.STATIC_DIR,
+            turbo_sms_config=settings.TURBO_SMS_CONFIG,
+            sender=settings.SMS_SENDER,
+            use_sso=settings.USE_SSO,
+            bot_token=settings.TELEGRAM_BOT_TOKEN,
+            billing_group_chat_id=settings.BILLING_MESSAGES_TELEGRAM_ID,
+            telegram_config=settings.TELEGRAM_CONFIG,
+            celery_broker_url=settings.CELERY_BROKER_URL,
+            notify_chunk_size=settings.NOTIFY_CHUNK_SIZE,
+            notify_checkpoint_size=settings.NOTIFY_CHECKPOINT_SIZE,
+            notify_retry_config=settings.NOTIFY_RETRY_CONFIG,
+            notify_upload_max_size=settings.NOTIFY_UPLOAD_MAX_SIZE,
+        )
+    )
+    replayed_count = loop.run_until_complete(
+        service.replay_dead_letters(
+            notify_uuid=UUID(notify_uuid) if notify_uuid else None
+        )
+    )
+    print(f"Replayed {replayed_count} dead letter messages")
+    loop.run_until_complete(service.close())
 
 
 if __name__ == "__main__":
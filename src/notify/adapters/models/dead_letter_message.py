@@ -0,0 +1,36 @@
+from datetime import datetime
+from typing import Annotated
+from uuid import UUID, uuid4
+
+from pydantic import Field
+
+from src.notify.adapters.models.base import BaseEntityModel
+from src.notify.adapters.models.notify import NotifyServices
+
+
+def _default_uuid():
+    return uuid4()
+
+
+def _default_datetime():
+    return datetime.now()
+
+
+class DeadLetterMessage(BaseEntityModel):
+    uuid: Annotated[UUID, Field(default_factory=_default_uuid)]
+    message_uuid: UUID
+    notify_uuid: UUID
+    chunk: int
+    sent_by: NotifyServices
+    user_id: int
+    phone_number: str | None = None
+    telegram_chat_id: int | None = None
+    attempts: int
+    error_code: int | None = None
+    error_description: str | None = None
+    created_at: Annotated[datetime, Field(default_factory=_default_datetime)]
+    replayed_at: datetime | None = None
+
+    @staticmethod
+    def get_entity_name():
+        return "dead_letter_messages"
@@ -6,6 +6,7 @@ from uuid import UUID, uuid4
 from pydantic import Field
 
 from src.notify.adapters.models.base import BaseEntityModel
+from src.notify.adapters.models.notify import NotifyServices
 
 
 def _default_uuid():
@@ -17,11 +18,23 @@ def _default_datetime():
 
 
 class MessageStatus(StrEnum):
+    PENDING = "Повідомлення очікує відправки"
+    DISPATCHING = "Повідомлення відправляється"
+    UNKNOWN = "Статус відправки невідомий, повторно не відправляється"
     SANDED = "Повідомлення відправленно"
+    FAILED = "Помилка відправки повідомлення"
+    BLOCKED = "Абонент заблокував телеграм бота"
+    RATE_LIMITED = "Перевищено ліміт відправки повідомлень"
+    RETRYING = "Повідомлення очікує повторної спроби відправки"
+    DEAD_LETTER = "Повідомлення не відправлено після всіх спроб"
+    CANCELLED = "Відправку повідомлення скасовано"
+    DELIVERED = "Повідомлення доставлено"
+    NOT_DELIVERED = "Повідомлення не доставлено"
     NOT_VALID_PHONE_NUMBER = "Не валідний номер телефона"
     PHONE_NUMBER_IS_REPEATED = "Номер телефона дуплікований"
     UNEXPECTED_ERROR = "Не відома помилка повторіть відправку"
     NOT_REGISTERED_TELEGRAM = "Абонент не підписаний на телеграм бота"
+    DUPLICATE_SUPPRESSED = "Таке повідомлення вже надсилалось абоненту нещодавно"
 
 
 class Message(BaseEntityModel):
@@ -29,9 +42,24 @@ class Message(BaseEntityModel):
     notify_uuid: UUID
     user_id: int
     phone_number: str | None = None
+    normalized_phone_number: str | None = None
+    message_hash: str | None = None
+    row_number: int | None = None
+    repeated_row_number: int | None = None
     telegram_chat_id: int | None = None
+    channel: NotifyServices | None = None
+    chunk: int | None = None
+    dispatch_token: UUID | None = None
+    dispatched_at: datetime | None = None
+    attempts: int = 0
+    next_attempt_at: datetime | None = None
     created_at: Annotated[datetime, Field(default_factory=_default_datetime)]
     status: MessageStatus
+    error_code: int | None = None
+    error_description: str | None = None
+    provider_message_id: str | None = None
+    delivery_status: str | None = None
+    delivery_checked_at: datetime | None = None
 
     @staticmethod
     def get_entity_name():
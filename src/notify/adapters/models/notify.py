@@ -19,6 +19,19 @@ def _default_datetime():
 class NotifyServices(StrEnum):
     TELEGRAM = "Telegram"
     SMS = "SMS"
+    MULTI_CHANNEL = "Telegram + SMS"
+
+
+class NotifyAttachmentType(StrEnum):
+    PHOTO = "photo"
+    DOCUMENT = "document"
+
+
+class NotifyStatus(StrEnum):
+    CREATED = "Створено"
+    IN_PROGRESS = "Відправляється"
+    FINISHED = "Завершено"
+    CANCELLED = "Скасовано"
 
 
 class Notify(BaseEntityModel):
@@ -28,6 +41,12 @@ class Notify(BaseEntityModel):
     notify_date: Annotated[datetime, Field(default_factory=_default_datetime)]
     message: str
     sent_by: NotifyServices
+    status: NotifyStatus = NotifyStatus.CREATED
+    chunks_count: int = 0
+    finished_chunks_count: int = 0
+    attachment_type: NotifyAttachmentType | None = None
+    attachment_file_id: str | None = None
+    cancelled_at: datetime | None = None
 
     @staticmethod
     def get_entity_name():
@@ -0,0 +1,28 @@
+from datetime import datetime
+from typing import Annotated
+from uuid import UUID, uuid4
+
+from pydantic import Field
+
+from src.notify.adapters.models.base import BaseEntityModel
+
+
+def _default_uuid():
+    return uuid4()
+
+
+def _default_datetime():
+    return datetime.now()
+
+
+class NotifyAttachment(BaseEntityModel):
+    uuid: Annotated[UUID, Field(default_factory=_default_uuid)]
+    notify_uuid: UUID
+    filename: str
+    content_type: str
+    content: bytes
+    created_at: Annotated[datetime, Field(default_factory=_default_datetime)]
+
+    @staticmethod
+    def get_entity_name():
+        return "notify_attachments"
@@ -0,0 +1,38 @@
+from datetime import datetime
+from enum import StrEnum
+from typing import Annotated
+from uuid import UUID, uuid4
+
+from pydantic import Field
+
+from src.notify.adapters.models.base import BaseEntityModel
+
+
+def _default_uuid():
+    return uuid4()
+
+
+def _default_datetime():
+    return datetime.now()
+
+
+class NotifyOutboxStatus(StrEnum):
+    PENDING = "pending"
+    PROCESSING = "processing"
+    DONE = "done"
+
+
+class NotifyOutbox(BaseEntityModel):
+    uuid: Annotated[UUID, Field(default_factory=_default_uuid)]
+    notify_uuid: UUID
+    chunk: int
+    status: NotifyOutboxStatus = NotifyOutboxStatus.PENDING
+    created_at: Annotated[datetime, Field(default_factory=_default_datetime)]
+    enqueued_at: Annotated[datetime, Field(default_factory=_default_datetime)]
+    claimed_at: datetime | None = None
+    dispatched_count: int = 0
+    checkpoint_at: datetime | None = None
+
+    @staticmethod
+    def get_entity_name():
+        return "notify_outbox"
@@ -16,6 +16,9 @@ class TelegramUser(BaseModel):
     personal_account_id: int | None = None
     billing_id: int | None = None
     phone_number: str | None = None
+    is_unreachable: bool = False
+    unreachable_at: datetime | None = None
+    unreachable_reason: str | None = None
     created_at: Annotated[datetime, Field(default_factory=_default_datetime)]
     updated_at: Annotated[datetime, Field(default_factory=_default_datetime)]
 
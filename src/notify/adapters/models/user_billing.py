@@ -1,12 +1,11 @@
 from builtins import UnicodeDecodeError
 from typing import Annotated
 
-import phonenumbers
-from phonenumbers.phonenumberutil import NumberParseException
 from pydantic import BaseModel, Field, field_validator, model_validator
 
 from src.notify.adapters.models.base import NaNToEmptyStr
 from src.notify.adapters.models.message import MessageStatus
+from src.notify.helpers.phone_numbers import normalize_phone_number
 
 
 class UserBilling(BaseModel):
@@ -98,14 +97,15 @@ class UserBillingMessageData(BaseModel):
     id: Annotated[int, Field(alias="Абонент ID")]
     phone_number: Annotated[NaNToEmptyStr, Field(alias="Номер телефону")]
     status: MessageStatus | None = None
+    normalized_phone_number: str | None = None
+    row_number: int | None = None
+    repeated_row_number: int | None = None
 
     @model_validator(mode="after")
     def pre_save(self):
-        try:
-            phone = phonenumbers.parse(self.phone_number)
-            if not phonenumbers.is_valid_number(phone):
-                self.status = MessageStatus.NOT_VALID_PHONE_NUMBER
-        except NumberParseException:
+        self.normalized_phone_number = normalize_phone_number(self.phone_number)
+        if self.normalized_phone_number is None:
             self.status = MessageStatus.NOT_VALID_PHONE_NUMBER
-        self.status = MessageStatus.SANDED
+        else:
+            self.status = MessageStatus.PENDING
         return self
@@ -0,0 +1,2 @@
+class NotifyAttachmentQueryStorage:
+    pass
@@ -0,0 +1,48 @@
+from datetime import datetime
+from uuid import UUID
+
+from pymongo import InsertOne
+
+from src.notify.adapters.models.dead_letter_message import DeadLetterMessage
+from src.notify.adapters.queries.dead_letter_message_query import (
+    DeadLetterMessageQueryStorage,
+)
+from src.notify.adapters.repos.base import BaseMotorRepo
+
+
+class DeadLetterMessageRepo(BaseMotorRepo):
+    MODEL = DeadLetterMessage
+    query_storage = DeadLetterMessageQueryStorage()
+
+    async def init_indexes(self):
+        await self.collection.create_index([("uuid", 1)], unique=True)
+        await self.collection.create_index([("notify_uuid", 1), ("replayed_at", 1)])
+        await self.collection.create_index([("replayed_at", 1), ("created_at", 1)])
+
+    async def bulk_save_dead_letters(
+        self, dead_letters: list[DeadLetterMessage]
+    ) -> list[DeadLetterMessage]:
+        await self.bulk_write(
+            [InsertOne(document=entry.model_dump()) for entry in dead_letters]
+        )
+        return dead_letters
+
+    async def get_not_replayed_list(
+        self, notify_uuid: UUID | None, limit: int
+    ) -> list[DeadLetterMessage]:
+        _filter = {"replayed_at": None}
+        if notify_uuid is not None:
+            _filter["notify_uuid"] = notify_uuid
+        results = (
+            await self.collection.find(_filter)
+            .sort("created_at", 1)
+            .limit(limit=limit)
+            .to_list(length=None)
+        )
+        return [self.MODEL(**res) for res in results]
+
+    async def mark_replayed(self, dead_letter_uuids: list[UUID]) -> None:
+        await self.collection.update_many(
+            {"uuid": {"$in": dead_letter_uuids}},
+            {"$set": {"replayed_at": datetime.now()}},
+        )
@@ -1,9 +1,11 @@
-from uuid import UUID
+from datetime import datetime
+from uuid import UUID, uuid4
 
 from motor.core import AgnosticClientSession
-from pymongo import InsertOne
+from pymongo import InsertOne, UpdateOne
 
-from src.notify.adapters.models.message import Message
+from src.notify.adapters.models.message import Message, MessageStatus
+from src.notify.adapters.models.notify import NotifyServices
 from src.notify.adapters.queries.message_query import MessageQueryStorage
 from src.notify.adapters.repos.base import BaseMotorRepo
 
@@ -13,11 +15,28 @@ class MessageRepo(BaseMotorRepo):
     query_storage = MessageQueryStorage()
 
     async def init_indexes(self):
+        await self.collection.create_index([("uuid", 1)], unique=True)
         await self.collection.create_index([("notify_uuid", 1)])
+        await self.collection.create_index(
+            [("notify_uuid", 1), ("chunk", 1), ("status", 1)]
+        )
+        await self.collection.create_index([("dispatch_token", 1)], sparse=True)
         await self.collection.create_index([("user_uuid", 1)])
+        await self.collection.create_index(
+            [("status", 1), ("delivery_checked_at", 1)],
+            partialFilterExpression={"provider_message_id": {"$type": "string"}},
+        )
+        await self.collection.create_index(
+            [("notify_uuid", 1), ("normalized_phone_number", 1)],
+            partialFilterExpression={"channel": NotifyServices.SMS},
+        )
+        await self.collection.create_index(
+            [("message_hash", 1), ("normalized_phone_number", 1), ("created_at", -1)],
+            partialFilterExpression={"message_hash": {"$type": "string"}},
+        )
 
     async def bulk_save_messages(
-        self, messages: list[Message], session: AgnosticClientSession
+        self, messages: list[Message], session: AgnosticClientSession = None
     ) -> list[Message]:
         bulk_messages_inserts = [
             InsertOne(document=message.model_dump()) for message in messages
@@ -26,12 +45,229 @@ class MessageRepo(BaseMotorRepo):
         limit = 100
         for offset in range(0, count, limit):
             await self.bulk_write(
-                bulk_messages_inserts[offset : offset + limit], session=session
-            ),
+                bulk_messages_inserts[offset : offset + limit],
+                session=session,
+                raise_error=True,
+            )
         return messages
 
+    async def get_recently_sent_phone_numbers(
+        self,
+        phone_numbers: list[str],
+        message_hash: str,
+        sent_after: datetime,
+        statuses: list[MessageStatus],
+    ) -> dict[str, set[UUID]]:
+        sent_phone_numbers = {}
+        limit = 1000
+        for offset in range(0, len(phone_numbers), limit):
+            results = await self.collection.find(
+                {
+                    "message_hash": message_hash,
+                    "normalized_phone_number": {
+                        "$in": phone_numbers[offset : offset + limit]
+                    },
+                    "created_at": {"$gte": sent_after},
+                    "channel": NotifyServices.SMS,
+                    "status": {"$in": statuses},
+                },
+                {"_id": 0, "normalized_phone_number": 1, "notify_uuid": 1},
+            ).to_list(length=None)
+            for res in results:
+                sent_phone_numbers.setdefault(
+                    res["normalized_phone_number"], set()
+                ).add(res["notify_uuid"])
+        return sent_phone_numbers
+
+    async def get_notify_sms_phone_numbers(
+        self,
+        notify_uuid: UUID,
+        phone_numbers: list[str],
+        statuses: list[MessageStatus],
+    ) -> set[str]:
+        results = await self.collection.find(
+            {
+                "notify_uuid": notify_uuid,
+                "normalized_phone_number": {"$in": phone_numbers},
+                "channel": NotifyServices.SMS,
+                "status": {"$in": statuses},
+            },
+            {"_id": 0, "normalized_phone_number": 1},
+        ).to_list(length=None)
+        return {res["normalized_phone_number"] for res in results}
+
+    async def delete_notify_messages(self, notify_uuid: UUID) -> None:
+        await self.collection.delete_many({"notify_uuid": notify_uuid})
+
+    async def bulk_update_statuses(
+        self, messages: list[Message], session: AgnosticClientSession = None
+    ) -> None:
+        bulk_messages_updates = [
+            UpdateOne(
+                filter={"uuid": message.uuid},
+                update={
+                    "$set": {
+                        "status": message.status,
+                        "channel": message.channel,
+                        "error_code": message.error_code,
+                        "error_description": message.error_description,
+                        "attempts": message.attempts,
+                        "next_attempt_at": message.next_attempt_at,
+                        "provider_message_id": message.provider_message_id,
+                    }
+                },
+            )
+            for message in messages
+        ]
+        count = len(bulk_messages_updates)
+        limit = 100
+        for offset in range(0, count, limit):
+            await self.bulk_write(
+                bulk_messages_updates[offset : offset + limit], session=session
+            )
+
     async def get_list(self, notify_uuid: UUID) -> list[Message]:
         results = await self.collection.find(
             {} if notify_uuid is None else {"notify_uuid": notify_uuid}
         ).to_list(length=None)
         return [self.MODEL(**res) for res in results]
+
+    async def claim_chunk_messages(
+        self, notify_uuid: UUID, chunk: int, limit: int
+    ) -> list[Message]:
+        dispatch_token = uuid4()
+        while True:
+            _filter = {
+                "notify_uuid": notify_uuid,
+                "chunk": chunk,
+                "$or": [
+                    {"status": MessageStatus.PENDING},
+                    {
+                        "status": MessageStatus.RETRYING,
+                        "next_attempt_at": {"$lte": datetime.now()},
+                    },
+                ],
+            }
+            docs = (
+                await self.collection.find(_filter, projection={"uuid": 1})
+                .limit(limit=limit)
+                .to_list(length=None)
+            )
+            if not docs:
+                return []
+            await self.collection.update_many(
+                {**_filter, "uuid": {"$in": [doc["uuid"] for doc in docs]}},
+                {
+                    "$set": {
+                        "status": MessageStatus.DISPATCHING,
+                        "dispatch_token": dispatch_token,
+                        "dispatched_at": datetime.now(),
+                    }
+                },
+            )
+            results = await self.collection.find(
+                {"dispatch_token": dispatch_token}
+            ).to_list(length=None)
+            if results:
+                return [self.MODEL(**res) for res in results]
+
+    async def mark_interrupted(self, notify_uuid: UUID, chunk: int) -> int:
+        result = await self.collection.update_many(
+            {
+                "notify_uuid": notify_uuid,
+                "chunk": chunk,
+                "status": MessageStatus.DISPATCHING,
+            },
+            {"$set": {"status": MessageStatus.UNKNOWN}},
+        )
+        return result.modified_count
+
+    async def get_next_attempt_at(
+        self, notify_uuid: UUID, chunk: int
+    ) -> datetime | None:
+        doc = await self.collection.find_one(
+            {
+                "notify_uuid": notify_uuid,
+                "chunk": chunk,
+                "status": MessageStatus.RETRYING,
+            },
+            projection={"next_attempt_at": 1},
+            sort=[("next_attempt_at", 1)],
+        )
+        return doc["next_attempt_at"] if doc else None
+
+    async def reset_for_replay(self, message_uuids: list[UUID]) -> None:
+        await self.collection.update_many(
+            {
+                "uuid": {"$in": message_uuids},
+                "status": {
+                    "$in": [MessageStatus.DEAD_LETTER, MessageStatus.RATE_LIMITED]
+                },
+            },
+            {
+                "$set": {
+                    "status": MessageStatus.PENDING,
+                    "attempts": 0,
+                    "next_attempt_at": None,
+                }
+            },
+        )
+
+    async def cancel_unsent(self, notify_uuid: UUID) -> int:
+        result = await self.collection.update_many(
+            {
+                "notify_uuid": notify_uuid,
+                "status": {"$in": [MessageStatus.PENDING, MessageStatus.RETRYING]},
+            },
+            {"$set": {"status": MessageStatus.CANCELLED, "next_attempt_at": None}},
+        )
+        return result.modified_count
+
+    async def get_delivery_pending_list(
+        self, dispatched_after: datetime, checked_before: datetime, limit: int
+    ) -> list[Message]:
+        results = (
+            await self.collection.find(
+                {
+                    "status": MessageStatus.SANDED,
+                    "provider_message_id": {"$type": "string"},
+                    "dispatched_at": {"$gte": dispatched_after},
+                    "$or": [
+                        {"delivery_checked_at": None},
+                        {"delivery_checked_at": {"$lt": checked_before}},
+                    ],
+                }
+            )
+            .sort("delivery_checked_at", 1)
+            .limit(limit=limit)
+            .to_list(length=None)
+        )
+        return [self.MODEL(**res) for res in results]
+
+    async def bulk_update_delivery_statuses(self, messages: list[Message]) -> None:
+        bulk_messages_updates = [
+            UpdateOne(
+                filter={"uuid": message.uuid},
+                update={
+                    "$set": {
+                        "status": message.status,
+                        "delivery_status": message.delivery_status,
+                        "delivery_checked_at": message.delivery_checked_at,
+                    }
+                },
+            )
+            for message in messages
+        ]
+        count = len(bulk_messages_updates)
+        limit = 100
+        for offset in range(0, count, limit):
+            await self.bulk_write(bulk_messages_updates[offset : offset + limit])
+
+    async def get_statuses_count(self, notify_uuid: UUID) -> dict[str, int]:
+        results = await self.collection.aggregate(
+            [
+                {"$match": {"notify_uuid": notify_uuid}},
+                {"$group": {"_id": "$status", "count": {"$sum": 1}}},
+            ]
+        ).to_list(length=None)
+        return {res["_id"]: res["count"] for res in results}
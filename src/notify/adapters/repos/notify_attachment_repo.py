@@ -0,0 +1,29 @@
+from uuid import UUID
+
+from src.notify.adapters.models.notify_attachment import NotifyAttachment
+from src.notify.adapters.queries.notify_attachment_query import (
+    NotifyAttachmentQueryStorage,
+)
+from src.notify.adapters.repos.base import BaseMotorRepo
+from src.notify.adapters.repos.exceptions import RepoObjectNotFound
+
+
+class NotifyAttachmentRepo(BaseMotorRepo):
+    MODEL = NotifyAttachment
+    query_storage = NotifyAttachmentQueryStorage()
+
+    async def init_indexes(self):
+        await self.collection.create_index([("notify_uuid", 1)], unique=True)
+
+    async def save_attachment(self, attachment: NotifyAttachment) -> NotifyAttachment:
+        await self.collection.insert_one(attachment.model_dump())
+        return attachment
+
+    async def retrieve(self, notify_uuid: UUID) -> NotifyAttachment:
+        doc = await self.collection.find_one({"notify_uuid": notify_uuid})
+        if not doc:
+            raise RepoObjectNotFound(message="Notify attachment not found")
+        return self.MODEL(**doc)
+
+    async def delete_attachment(self, notify_uuid: UUID) -> None:
+        await self.collection.delete_one({"notify_uuid": notify_uuid})
@@ -0,0 +1,165 @@
+from datetime import datetime
+from uuid import UUID
+
+from motor.core import AgnosticClientSession
+from pymongo import InsertOne, ReturnDocument
+
+from src.notify.adapters.models.notify_outbox import NotifyOutbox, NotifyOutboxStatus
+from src.notify.adapters.queries.notify_outbox_query import NotifyOutboxQueryStorage
+from src.notify.adapters.repos.base import BaseMotorRepo
+
+
+class NotifyOutboxRepo(BaseMotorRepo):
+    MODEL = NotifyOutbox
+    query_storage = NotifyOutboxQueryStorage()
+
+    async def init_indexes(self):
+        await self.collection.create_index(
+            [("notify_uuid", 1), ("chunk", 1)], unique=True
+        )
+        await self.collection.create_index([("status", 1), ("enqueued_at", 1)])
+        await self.collection.create_index([("status", 1), ("claimed_at", 1)])
+
+    async def bulk_save_outbox(
+        self, outbox: list[NotifyOutbox], session: AgnosticClientSession
+    ) -> list[NotifyOutbox]:
+        await self.bulk_write(
+            [InsertOne(document=entry.model_dump()) for entry in outbox],
+            session=session,
+            raise_error=True,
+        )
+        return outbox
+
+    async def claim(
+        self, notify_uuid: UUID, chunk: int, lease_expired_at: datetime
+    ) -> NotifyOutbox | None:
+        doc = await self.collection.find_one_and_update(
+            {
+                "notify_uuid": notify_uuid,
+                "chunk": chunk,
+                "$or": [
+                    {"status": NotifyOutboxStatus.PENDING},
+                    {
+                        "status": NotifyOutboxStatus.PROCESSING,
+                        "claimed_at": {"$lt": lease_expired_at},
+                    },
+                ],
+            },
+            {
+                "$set": {
+                    "status": NotifyOutboxStatus.PROCESSING,
+                    "claimed_at": datetime.now(),
+                }
+            },
+            return_document=ReturnDocument.AFTER,
+        )
+        return self.MODEL(**doc) if doc else None
+
+    async def mark_done(self, outbox_uuid: UUID) -> None:
+        await self.collection.update_one(
+            {"uuid": outbox_uuid}, {"$set": {"status": NotifyOutboxStatus.DONE}}
+        )
+
+    async def defer(self, outbox_uuid: UUID, enqueued_at: datetime = None) -> None:
+        await self.collection.update_one(
+            {"uuid": outbox_uuid},
+            {
+                "$set": {
+                    "status": NotifyOutboxStatus.PENDING,
+                    "enqueued_at": enqueued_at or datetime.now(),
+                }
+            },
+        )
+
+    async def reopen(self, notify_uuid: UUID, chunks: list[int]) -> list[NotifyOutbox]:
+        _filter = {"notify_uuid": notify_uuid, "chunk": {"$in": chunks}}
+        await self.collection.update_many(
+            _filter,
+            {
+                "$set": {
+                    "status": NotifyOutboxStatus.PENDING,
+                    "enqueued_at": datetime.now(),
+                }
+            },
+        )
+        results = await self.collection.find(_filter).to_list(length=None)
+        return [self.MODEL(**res) for res in results]
+
+    async def cancel(self, notify_uuid: UUID) -> None:
+        await self.collection.update_many(
+            {"notify_uuid": notify_uuid, "status": {"$ne": NotifyOutboxStatus.DONE}},
+            {"$set": {"status": NotifyOutboxStatus.DONE}},
+        )
+
+    async def save_checkpoint(self, outbox_uuid: UUID, dispatched_count: int) -> None:
+        now = datetime.now()
+        await self.collection.update_one(
+            {"uuid": outbox_uuid},
+            {
+                "$inc": {"dispatched_count": dispatched_count},
+                "$set": {"checkpoint_at": now, "claimed_at": now},
+            },
+        )
+
+    async def release_unfinished(
+        self, notify_uuid: UUID, lease_expired_at: datetime
+    ) -> list[NotifyOutbox]:
+        _filter = {
+            "notify_uuid": notify_uuid,
+            "$or": [
+                {"status": NotifyOutboxStatus.PENDING},
+                {
+                    "status": NotifyOutboxStatus.PROCESSING,
+                    "claimed_at": {"$lt": lease_expired_at},
+                },
+            ],
+        }
+        results = await self.collection.find(_filter).to_list(length=None)
+        if not results:
+            return []
+        await self.collection.update_many(
+            {**_filter, "uuid": {"$in": [res["uuid"] for res in results]}},
+            {
+                "$set": {
+                    "status": NotifyOutboxStatus.PENDING,
+                    "enqueued_at": datetime.now(),
+                }
+            },
+        )
+        return [self.MODEL(**res) for res in results]
+
+    async def get_unfinished_count(self, notify_uuid: UUID) -> int:
+        return await self.collection.count_documents(
+            {
+                "notify_uuid": notify_uuid,
+                "status": {"$ne": NotifyOutboxStatus.DONE},
+            }
+        )
+
+    async def mark_enqueued(self, outbox_uuids: list[UUID]) -> None:
+        await self.collection.update_many(
+            {"uuid": {"$in": outbox_uuids}}, {"$set": {"enqueued_at": datetime.now()}}
+        )
+
+    async def get_stale_list(
+        self, enqueued_before: datetime, lease_expired_at: datetime, limit: int
+    ) -> list[NotifyOutbox]:
+        results = (
+            await self.collection.find(
+                {
+                    "$or": [
+                        {
+                            "status": NotifyOutboxStatus.PENDING,
+                            "enqueued_at": {"$lt": enqueued_before},
+                        },
+                        {
+                            "status": NotifyOutboxStatus.PROCESSING,
+                            "claimed_at": {"$lt": lease_expired_at},
+                        },
+                    ]
+                }
+            )
+            .limit(limit=limit)
+            .to_list(length=None)
+        )
+        return [self.MODEL(**res) for res in results]
@@ -1,8 +1,12 @@
+from datetime import datetime
+from uuid import UUID
+
 from motor.core import AgnosticClientSession
 
-from src.notify.adapters.models.notify import Notify
+from src.notify.adapters.models.notify import Notify, NotifyStatus
 from src.notify.adapters.queries.notify_query import NotifyQueryStorage
 from src.notify.adapters.repos.base import BaseMotorRepo
+from src.notify.adapters.repos.exceptions import RepoObjectNotFound
 
 
 class NotifyRepo(BaseMotorRepo):
@@ -11,6 +15,7 @@ class NotifyRepo(BaseMotorRepo):
 
     async def init_indexes(self):
         await self.collection.create_index([("username", 1)])
+        await self.collection.create_index([("uuid", 1)], unique=True)
 
     async def save_notify(
         self, notify: Notify, session: AgnosticClientSession
@@ -34,3 +39,78 @@ class NotifyRepo(BaseMotorRepo):
             .to_list(length=None)
         )
         return [self.MODEL(**res) for res in results]
+
+    async def retrieve(self, notify_uuid: UUID) -> Notify:
+        doc = await self.collection.find_one({"uuid": notify_uuid})
+        if not doc:
+            raise RepoObjectNotFound(message="Notify not found")
+        return self.MODEL(**doc)
+
+    async def get_existing_uuids(self, notify_uuids: list[UUID]) -> set[UUID]:
+        results = await self.collection.find(
+            {"uuid": {"$in": notify_uuids}}, {"_id": 0, "uuid": 1}
+        ).to_list(length=None)
+        return {res["uuid"] for res in results}
+
+    async def update_status(self, notify_uuid: UUID, status: NotifyStatus) -> None:
+        await self.collection.update_one(
+            {"uuid": notify_uuid, "status": {"$ne": NotifyStatus.CANCELLED}},
+            {"$set": {"status": status}},
+        )
+
+    async def cancel(self, notify_uuid: UUID) -> bool:
+        result = await self.collection.update_one(
+            {
+                "uuid": notify_uuid,
+                "status": {"$in": [NotifyStatus.CREATED, NotifyStatus.IN_PROGRESS]},
+            },
+            {
+                "$set": {
+                    "status": NotifyStatus.CANCELLED,
+                    "cancelled_at": datetime.now(),
+                }
+            },
+        )
+        return result.modified_count == 1
+
+    async def is_cancelled(self, notify_uuid: UUID) -> bool:
+        doc = await self.collection.find_one(
+            {"uuid": notify_uuid, "status": NotifyStatus.CANCELLED},
+            projection={"_id": 1},
+        )
+        return doc is not None
+
+    async def set_attachment_file_id(self, notify_uuid: UUID, file_id: str) -> None:
+        await self.collection.update_one(
+            {"uuid": notify_uuid, "attachment_file_id": None},
+            {"$set": {"attachment_file_id": file_id}},
+        )
+
+    async def update_progress(
+        self, notify_uuid: UUID, finished_chunks_count: int, unfinished_count: int
+    ) -> None:
+        # Workers finish chunks concurrently, so progress only ever moves forward
+        # and the notify is finished by whichever worker sees no chunks left.
+        await self.collection.update_one(
+            {"uuid": notify_uuid},
+            {"$max": {"finished_chunks_count": finished_chunks_count}},
+        )
+        if unfinished_count == 0:
+            await self.collection.update_one(
+                {
+                    "uuid": notify_uuid,
+                    "status": {"$in": [NotifyStatus.CREATED, NotifyStatus.IN_PROGRESS]},
+                },
+                {"$set": {"status": NotifyStatus.FINISHED}},
+            )
+
+    async def reopen(self, notify_uuid: UUID, finished_chunks_count: int) -> None:
+        await self.collection.update_one(
+            {"uuid": notify_uuid, "status": {"$ne": NotifyStatus.CANCELLED}},
+            {
+                "$set": {
+                    "status": NotifyStatus.IN_PROGRESS,
+                    "finished_chunks_count": finished_chunks_count,
+                }
+            },
+        )
@@ -0,0 +1,24 @@
+from uuid import UUID
+
+from celery import Celery
+
+from src.notify.adapters.repos.base import BaseRepository
+
+
+class NotifyTasksRepo(BaseRepository):
+    SEND_NOTIFY_CHUNK_TASK = "src.notify.taskapp.tasks.notify_tasks.send_notify_chunk"
+
+    celery_app: Celery
+
+    def __init__(self, broker_url: str):
+        super().__init__()
+        self.celery_app = Celery(broker=broker_url)
+
+    def send_notify_chunk(
+        self, notify_uuid: UUID, chunk: int, countdown: float | None = None
+    ) -> None:
+        self.celery_app.send_task(
+            self.SEND_NOTIFY_CHUNK_TASK,
+            kwargs={"notify_uuid": str(notify_uuid), "chunk": chunk},
+            countdown=countdown,
+        )
@@ -1,32 +1,168 @@
 import asyncio
+import logging
+from typing import Awaitable, Callable
 
 from src.notify.adapters.repos.base import BaseRepository
-from src.notify.clients.telegram_client import TelegramClient
+from src.notify.clients.telegram_client import (
+    TelegramClient,
+    TelegramMedia,
+    TelegramSendResult,
+    create_telegram_rate_limiter,
+)
+from src.notify.config import TelegramConfig
+from src.notify.helpers.circuit_breaker import create_circuit_breaker_state_store
+from src.notify.helpers.message_coalescer import MessageCoalescer
+from src.notify.helpers.rate_limit import (
+    KeyIntervalLimiter,
+    RedisTokenBucket,
+    TokenBucket,
+    create_token_bucket,
+)
+
+logger = logging.getLogger(__name__)
 
 
 class TelegramNotifyRepo(BaseRepository):
+    MESSAGE_MAX_LENGTH = 4096
+
     telegram_client: TelegramClient
     billing_group_chat_id: int
+    chat_rate_limiter: KeyIntervalLimiter
+    group_rate_limiter: TokenBucket | RedisTokenBucket
+    group_coalescer: MessageCoalescer
 
-    def __init__(self, bot_token: str, use_sso: bool, billing_group_chat_id: int):
+    def __init__(
+        self,
+        bot_token: str,
+        use_sso: bool,
+        billing_group_chat_id: int,
+        telegram_config: TelegramConfig,
+        rate_limit_url: str | None = None,
+    ):
         super().__init__()
         self.billing_group_chat_id = billing_group_chat_id
+        self.telegram_config = telegram_config
         self.telegram_client = TelegramClient(
-            telegram_bot_token=bot_token, use_sso=use_sso
+            telegram_bot_token=bot_token,
+            telegram_config=telegram_config,
+            rate_limiter=create_telegram_rate_limiter(
+                rate_limit_url=rate_limit_url,
+                bot_token=bot_token,
+                telegram_config=telegram_config,
+            ),
+            use_sso=use_sso,
+            circuit_breaker_state_store=create_circuit_breaker_state_store(
+                redis_url=rate_limit_url
+            ),
+        )
+        self.chat_rate_limiter = KeyIntervalLimiter(
+            interval=telegram_config.chat_message_interval
+        )
+        self.group_rate_limiter = create_token_bucket(
+            redis_url=rate_limit_url,
+            key=f"rate_limit:telegram_group:{billing_group_chat_id}",
+            rate=telegram_config.group_messages_per_minute / 60,
+            capacity=telegram_config.group_messages_per_minute,
+        )
+        self.group_coalescer = MessageCoalescer(
+            send=self._send_billing_group_message,
+            max_length=self.MESSAGE_MAX_LENGTH,
+            linger=telegram_config.group_message_linger,
+        )
+
+    async def close(self) -> None:
+        await self.flush_billing_group_messages()
+        await self.telegram_client.close()
+        await self.group_rate_limiter.close()
+
+    @property
+    def is_available(self) -> bool:
+        return not self.telegram_client.circuit_breaker.is_open
+
+    async def get_circuit_breaker_state(self) -> dict:
+        return await self.telegram_client.circuit_breaker.get_shared_state()
+
+    async def _send(
+        self, chat_id: int, send: Callable[[], Awaitable[TelegramSendResult]]
+    ) -> TelegramSendResult:
+        for _ in range(self.telegram_config.max_retry_after_attempts + 1):
+            await self.chat_rate_limiter.acquire(chat_id)
+            result = await send()
+            if result.retry_after is None:
+                return result
+            logger.warning(
+                "Telegram rate limit exceeded, retry after %s seconds",
+                result.retry_after,
+            )
+        return result
+
+    async def _send_message(self, chat_id: int, text: str) -> TelegramSendResult:
+        return await self._send(
+            chat_id=chat_id,
+            send=lambda: self.telegram_client.send_message(chat_id=chat_id, text=text),
+        )
+
+    async def _send_media(
+        self, chat_id: int, media: TelegramMedia, caption: str
+    ) -> TelegramSendResult:
+        return await self._send(
+            chat_id=chat_id,
+            send=lambda: self.telegram_client.send_media(
+                chat_id=chat_id, media=media, caption=caption
+            ),
+        )
+
+    async def _gather(
+        self, chat_ids: set[int], send: Callable[[int], Awaitable[TelegramSendResult]]
+    ) -> dict[int, TelegramSendResult]:
+        in_flight = asyncio.Semaphore(self.telegram_config.max_in_flight)
+
+        async def send_in_flight(chat_id: int) -> TelegramSendResult:
+            async with in_flight:
+                return await send(chat_id)
+
+        results = await asyncio.gather(
+            *[send_in_flight(chat_id) for chat_id in chat_ids]
         )
+        return {result.chat_id: result for result in results}
 
     async def send_telegram_users_messages(
         self, chat_ids: list[int], text: str
-    ) -> bool:
-        results = await asyncio.gather(
-            *[
-                self.telegram_client.send_message(chat_id=chat_id, text=text)
-                for chat_id in chat_ids
-            ]
+    ) -> dict[int, TelegramSendResult]:
+        return await self._gather(
+            chat_ids=set(chat_ids),
+            send=lambda chat_id: self._send_message(chat_id=chat_id, text=text),
         )
-        return all(results)
 
-    async def send_message_billing_in_telegram_group(self, text: str):
-        await self.telegram_client.send_message(
-            chat_id=self.billing_group_chat_id, text=text
+    async def send_telegram_users_media(
+        self, chat_ids: list[int], media: TelegramMedia, caption: str
+    ) -> dict[int, TelegramSendResult]:
+        results = {}
+        chat_ids = list(dict.fromkeys(chat_ids))
+        # Upload the file once, then send the cached file_id to everyone else.
+        while media.file_id is None and chat_ids:
+            chat_id = chat_ids.pop(0)
+            result = await self._send_media(
+                chat_id=chat_id, media=media, caption=caption
+            )
+            results[chat_id] = result
+            media.file_id = result.file_id
+        results.update(
+            await self._gather(
+                chat_ids=set(chat_ids),
+                send=lambda chat_id: self._send_media(
+                    chat_id=chat_id, media=media, caption=caption
+                ),
+            )
         )
+        return results
+
+    async def _send_billing_group_message(self, text: str) -> TelegramSendResult:
+        await self.group_rate_limiter.acquire()
+        return await self._send_message(chat_id=self.billing_group_chat_id, text=text)
+
+    async def send_message_billing_in_telegram_group(self, text: str):
+        await self.group_coalescer.add(text)
+
+    async def flush_billing_group_messages(self):
+        await self.group_coalescer.flush()
@@ -1,3 +1,7 @@
+from datetime import datetime
+
+from pymongo import UpdateOne
+
 from src.notify.adapters.models.telegram_user import TelegramUser
 from src.notify.adapters.queries.telegram_user_query import TelegramUserQuery
 from src.notify.adapters.repos.base import BaseMotorRepo
@@ -11,6 +15,8 @@ class TelegramUsersRepo(BaseMotorRepo):
         await self.collection.create_index([("chat_id", 1)], unique=True)
         await self.collection.create_index([("personal_account_id", 1)])
         await self.collection.create_index([("phone_number", 1)])
+        await self.collection.create_index([("phone_number", 1), ("is_unreachable", 1)])
+        await self.collection.create_index([("billing_id", 1), ("is_unreachable", 1)])
 
     async def save_user(self, telegram_user: TelegramUser) -> TelegramUser:
         await self.collection.replace_one(
@@ -25,18 +31,40 @@ class TelegramUsersRepo(BaseMotorRepo):
         return TelegramUser(**user)
 
     async def get_list(
-        self, phone_numbers: list[str], billing_ids: list[int]
+        self,
+        phone_numbers: list[str],
+        billing_ids: list[int],
+        include_unreachable: bool = False,
     ) -> list[TelegramUser]:
-        results = await self.collection.find(
-            {
-                "$or": [
-                    {"billing_id": {"$in": billing_ids}},
-                    {"phone_number": {"$in": phone_numbers}},
-                ]
-            }
-        ).to_list(length=None)
+        _filter = {
+            "$or": [
+                {"billing_id": {"$in": billing_ids}},
+                {"phone_number": {"$in": phone_numbers}},
+            ]
+        }
+        if include_unreachable is False:
+            _filter["is_unreachable"] = {"$ne": True}
+        results = await self.collection.find(_filter).to_list(length=None)
         return [TelegramUser(**user) for user in results]
 
+    async def mark_unreachable(self, reasons: dict[int, str]) -> None:
+        now = datetime.now()
+        await self.bulk_write(
+            [
+                UpdateOne(
+                    filter={"chat_id": chat_id},
+                    update={
+                        "$set": {
+                            "is_unreachable": True,
+                            "unreachable_at": now,
+                            "unreachable_reason": reason,
+                        }
+                    },
+                )
+                for chat_id, reason in reasons.items()
+            ]
+        )
+
     async def update_user_billing_and_personal_account_id(
         self, personal_account_id: int, billing_id: int, chat_id: int
     ):
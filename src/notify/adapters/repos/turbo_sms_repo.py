@@ -1,21 +1,166 @@
+import asyncio
+import logging
+from time import monotonic
+
 from src.notify.adapters.repos.base import BaseRepository
+from src.notify.clients.local_sms_client import LocalSMSClient
+from src.notify.clients.sms_provider_client import SMSProviderClient, SMSSendResult
+from src.notify.clients.turbo_sms_http_client import TurboSMSHTTPClient
 from src.notify.clients.turmo_sms_client import TurboSMSClient
-from src.notify.config import TurboSMSConfig
+from src.notify.config import TurboSMSConfig, TurboSMSProvider
+from src.notify.helpers.circuit_breaker import create_circuit_breaker_state_store
+from src.notify.helpers.rate_limit import create_token_bucket
+
+logger = logging.getLogger(__name__)
 
 
 class TurboSMSRepo(BaseRepository):
-    turbo_sms_client: TurboSMSClient
+    turbo_sms_client: SMSProviderClient
+
+    _balance: float | None = None
+    _balance_updated_at: float = 0.0
+    _balance_refresh_task: asyncio.Task | None = None
 
-    def __init__(self, turbo_sms_config: TurboSMSConfig, sender: str, use_sso: bool):
+    def __init__(
+        self,
+        turbo_sms_config: TurboSMSConfig,
+        sender: str,
+        use_sso: bool,
+        rate_limit_url: str | None = None,
+    ):
         super().__init__()
-        self.turbo_sms_client = TurboSMSClient(
-            turbo_sms_config=turbo_sms_config, sender=sender, use_sso=use_sso
+        self.turbo_sms_config = turbo_sms_config
+        self._balance_lock = asyncio.Lock()
+        self.turbo_sms_client = self._create_client(
+            turbo_sms_config=turbo_sms_config,
+            sender=sender,
+            use_sso=use_sso,
+            rate_limit_url=rate_limit_url,
+        )
+
+    @staticmethod
+    def _create_client(
+        turbo_sms_config: TurboSMSConfig,
+        sender: str,
+        use_sso: bool,
+        rate_limit_url: str | None,
+    ) -> SMSProviderClient:
+        provider = turbo_sms_config.provider
+        if provider == TurboSMSProvider.HTTP and not turbo_sms_config.api_token:
+            logger.warning("TurboSMS api_token is not set, falling back to SOAP")
+            provider = TurboSMSProvider.SOAP
+        rate_limiter = create_token_bucket(
+            redis_url=rate_limit_url,
+            key=f"rate_limit:turbo_sms:{turbo_sms_config.login or sender}",
+            rate=turbo_sms_config.requests_per_second,
+        )
+        circuit_breaker_state_store = create_circuit_breaker_state_store(
+            redis_url=rate_limit_url
+        )
+        if provider == TurboSMSProvider.LOCAL:
+            return LocalSMSClient(
+                turbo_sms_config=turbo_sms_config,
+                sender=sender,
+                use_sso=True,
+                rate_limiter=rate_limiter,
+                circuit_breaker_state_store=circuit_breaker_state_store,
+            )
+        client_class = (
+            TurboSMSHTTPClient if provider == TurboSMSProvider.HTTP else TurboSMSClient
+        )
+        return client_class(
+            turbo_sms_config=turbo_sms_config,
+            sender=sender,
+            use_sso=use_sso,
+            rate_limiter=rate_limiter,
+            circuit_breaker_state_store=circuit_breaker_state_store,
+        )
+
+    async def warm_up(self) -> None:
+        await self.turbo_sms_client.warm_up()
+
+    async def close(self) -> None:
+        await self.turbo_sms_client.close()
+
+    @property
+    def is_available(self) -> bool:
+        return not self.turbo_sms_client.circuit_breaker.is_open
+
+    async def get_circuit_breaker_state(self) -> dict:
+        return await self.turbo_sms_client.circuit_breaker.get_shared_state()
+
+    async def send_billing_user_sms(
+        self, phonenumbers: list[str], text: str
+    ) -> dict[str, SMSSendResult]:
+        phonenumbers = list(dict.fromkeys(phonenumbers))
+        limit = self.turbo_sms_config.max_recipients_per_request
+        in_flight = asyncio.Semaphore(self.turbo_sms_config.max_concurrent_requests)
+
+        async def send_chunk(chunk: list[str]) -> dict[str, SMSSendResult]:
+            async with in_flight:
+                return await self.turbo_sms_client.send_sms(
+                    phone_numbers=chunk, text=text
+                )
+
+        chunks_results = await asyncio.gather(
+            *[
+                send_chunk(phonenumbers[offset : offset + limit])
+                for offset in range(0, len(phonenumbers), limit)
+            ]
         )
+        return {
+            phone_number: result
+            for chunk_results in chunks_results
+            for phone_number, result in chunk_results.items()
+        }
 
-    async def send_billing_user_sms(self, phonenumbers: list[str], text: str) -> bool:
-        return await self.turbo_sms_client.send_sms(
-            destination=",".join(phonenumbers), text=text
+    async def get_messages_statuses(
+        self, message_ids: list[str]
+    ) -> dict[str, str | None]:
+        return await self.turbo_sms_client.get_messages_statuses(
+            message_ids=message_ids
         )
 
-    async def get_current_balance(self):
-        return await self.turbo_sms_client.get_current_balance()
+    @property
+    def send_batch_size(self) -> int:
+        return (
+            self.turbo_sms_config.max_recipients_per_request
+            * self.turbo_sms_config.max_concurrent_requests
+        )
+
+    @property
+    def duplicate_window(self) -> float:
+        return self.turbo_sms_config.duplicate_window
+
+    def get_sms_cost(self, segments_count: int) -> float:
+        return segments_count * self.turbo_sms_config.sms_segment_price
+
+    async def _refresh_balance(self) -> float:
+        async with self._balance_lock:
+            age = monotonic() - self._balance_updated_at
+            if (
+                self._balance is None
+                or age >= self.turbo_sms_config.balance_refresh_after
+            ):
+                balance = await self.turbo_sms_client.get_current_balance()
+                self._balance = float(balance)
+                self._balance_updated_at = monotonic()
+            return self._balance
+
+    async def _refresh_balance_in_background(self) -> None:
+        try:
+            await self._refresh_balance()
+        except Exception:
+            logger.exception("TurboSMS balance refresh error")
+
+    async def get_current_balance(self) -> float:
+        age = monotonic() - self._balance_updated_at
+        if self._balance is None or age >= self.turbo_sms_config.balance_cache_ttl:
+            return await self._refresh_balance()
+        if age >= self.turbo_sms_config.balance_refresh_after and (
+            self._balance_refresh_task is None or self._balance_refresh_task.done()
+        ):
+            self._balance_refresh_task = asyncio.create_task(
+                self._refresh_balance_in_background()
+            )
+        return self._balance
@@ -1,37 +1,60 @@
 import csv
+import hashlib
 import logging
+from collections import defaultdict
 from csv import DictReader
 from datetime import datetime, timedelta
-from io import StringIO
+from io import TextIOWrapper
+from math import ceil
 from os import path
+from typing import AsyncIterator, Iterator
 from uuid import UUID
 
 import magic
 from aiomysql import Pool
 from fastapi import UploadFile
 from motor.motor_asyncio import AsyncIOMotorDatabase
-from pydantic import ValidationError
 
+from src.notify.adapters.models.dead_letter_message import DeadLetterMessage
 from src.notify.adapters.models.message import Message, MessageStatus
-from src.notify.adapters.models.notify import Notify, NotifyServices
+from src.notify.adapters.models.notify import (
+    Notify,
+    NotifyAttachmentType,
+    NotifyServices,
+    NotifyStatus,
+)
+from src.notify.adapters.models.notify_attachment import NotifyAttachment
+from src.notify.adapters.models.notify_outbox import NotifyOutbox
 from src.notify.adapters.models.telegram_connection_request import (
     TelegramConnectionRequest,
 )
 from src.notify.adapters.models.telegram_repair_request import TelegramRepairRequest
-from src.notify.adapters.models.user_billing import (
-    UserBillingFilter,
-    UserBillingMessageData,
-)
+from src.notify.adapters.models.user_billing import UserBillingFilter
 from src.notify.adapters.repos.billing_messages_repo import MessagesBillingRepo
+from src.notify.adapters.repos.dead_letter_message_repo import DeadLetterMessageRepo
 from src.notify.adapters.repos.message_repo import MessageRepo
+from src.notify.adapters.repos.notify_attachment_repo import NotifyAttachmentRepo
+from src.notify.adapters.repos.notify_outbox_repo import NotifyOutboxRepo
 from src.notify.adapters.repos.notify_repo import NotifyRepo
+from src.notify.adapters.repos.notify_tasks_repo import NotifyTasksRepo
 from src.notify.adapters.repos.telegram_notify_repo import TelegramNotifyRepo
 from src.notify.adapters.repos.telegram_user_repo import TelegramUsersRepo
 from src.notify.adapters.repos.turbo_sms_repo import TurboSMSRepo
 from src.notify.adapters.repos.user_biilling_repo import UsersBillingRepo
 from src.notify.adapters.services.base import BaseService, ServiceError
+from src.notify.adapters.services.utils.csv_utils import read_csv_in_chunks
+from src.notify.adapters.services.utils.user_billing_validation import (
+    UserBillingRow,
+    has_user_billing_columns,
+    validate_user_billing_rows,
+)
 from src.notify.api.v1.schemas.notify import NotifyQueryParams
-from src.notify.config import TurboSMSConfig
+from src.notify.clients.sms_provider_client import SMSProviderUnavailable
+from src.notify.clients.telegram_client import TelegramMedia, TelegramSendResult
+from src.notify.config import NotifyRetryConfig, TelegramConfig, TurboSMSConfig
+from src.notify.helpers.backoff import get_backoff_delay
+from src.notify.helpers.phone_numbers import normalize_phone_number
+from src.notify.helpers.sms_segments import get_sms_segments
 
 logger = logging.getLogger(__name__)
 
@@ -64,16 +87,77 @@ class NotifyService(BaseService):
         "Час обновлення MAC адреса",
     )
 
+    ATTACHMENT_TYPES = {
+        "image/jpeg": NotifyAttachmentType.PHOTO,
+        "image/png": NotifyAttachmentType.PHOTO,
+        "application/pdf": NotifyAttachmentType.DOCUMENT,
+    }
+    # 10 MB, Telegram photo upload limit
+    MAX_ATTACHMENT_SIZE = 10 * 1024 * 1024
+    MAX_CAPTION_LENGTH = 1024
+    NOTIFY_OUTBOX_LEASE = timedelta(minutes=10)
+    NOTIFY_OUTBOX_REDELIVERY_DELAY = timedelta(minutes=5)
+    DEAD_LETTERS_REPLAY_LIMIT = 10000
+    CSV_CHUNK_SIZE = 5000
+    SMS_DELIVERY_POLL_PERIOD = timedelta(days=3)
+    SMS_DELIVERY_POLL_INTERVAL = timedelta(minutes=5)
+    SMS_DELIVERY_POLL_BATCH_SIZE = 200
+    SMS_DELIVERY_POLL_LIMIT = 5000
+    SMS_DELIVERY_STATUSES = (
+        ("не доставлено", MessageStatus.NOT_DELIVERED),
+        ("просрочено", MessageStatus.NOT_DELIVERED),
+        ("отклонено", MessageStatus.NOT_DELIVERED),
+        ("удалено", MessageStatus.NOT_DELIVERED),
+        ("доставлено", MessageStatus.DELIVERED),
+        ("not_delivered", MessageStatus.NOT_DELIVERED),
+        ("undelivered", MessageStatus.NOT_DELIVERED),
+        ("expired", MessageStatus.NOT_DELIVERED),
+        ("rejected", MessageStatus.NOT_DELIVERED),
+        ("deleted", MessageStatus.NOT_DELIVERED),
+        ("failed", MessageStatus.NOT_DELIVERED),
+        ("delivered", MessageStatus.DELIVERED),
+    )
+    SMS_SENT_STATUSES = [
+        MessageStatus.PENDING,
+        MessageStatus.DISPATCHING,
+        MessageStatus.RETRYING,
+        MessageStatus.UNKNOWN,
+        MessageStatus.SANDED,
+        MessageStatus.DELIVERED,
+    ]
+    SMS_FALLBACK_STATUSES = (
+        MessageStatus.BLOCKED,
+        MessageStatus.FAILED,
+        MessageStatus.DEAD_LETTER,
+        MessageStatus.RATE_LIMITED,
+    )
+    DEAD_LETTER_STATUSES = (MessageStatus.DEAD_LETTER, MessageStatus.RATE_LIMITED)
+
     turbo_sms_repo: TurboSMSRepo
     notify_repo: NotifyRepo
+    notify_outbox_repo: NotifyOutboxRepo
+    notify_attachment_repo: NotifyAttachmentRepo
     message_repo: MessageRepo
+    dead_letter_message_repo: DeadLetterMessageRepo
     users_billing_repo: UsersBillingRepo
     telegram_users_repo: TelegramUsersRepo
     messages_billing_repo: MessagesBillingRepo
     telegram_notify_repo: TelegramNotifyRepo
+    notify_tasks_repo: NotifyTasksRepo
 
-    def __init__(self, static_dir_path):
+    def __init__(
+        self,
+        static_dir_path,
+        notify_chunk_size: int,
+        notify_checkpoint_size: int,
+        notify_retry_config: NotifyRetryConfig,
+        notify_upload_max_size: int,
+    ):
         self.static_dir_path = static_dir_path
+        self.notify_chunk_size = notify_chunk_size
+        self.notify_checkpoint_size = notify_checkpoint_size
+        self.notify_retry_config = notify_retry_config
+        self.notify_upload_max_size = notify_upload_max_size
         self.user_notify_report = path.join(
             self.static_dir_path, "user_notify_report.csv"
         )
@@ -89,13 +173,28 @@ class NotifyService(BaseService):
         use_sso: bool,
         bot_token: str,
         billing_group_chat_id: int,
+        telegram_config: TelegramConfig,
+        celery_broker_url: str,
+        notify_chunk_size: int,
+        notify_checkpoint_size: int,
+        notify_retry_config: NotifyRetryConfig,
+        notify_upload_max_size: int,
     ):
-        self = cls(static_dir_path=static_dir_path)
+        self = cls(
+            static_dir_path=static_dir_path,
+            notify_chunk_size=notify_chunk_size,
+            notify_checkpoint_size=notify_checkpoint_size,
+            notify_retry_config=notify_retry_config,
+            notify_upload_max_size=notify_upload_max_size,
+        )
         self.messages_billing_repo = await MessagesBillingRepo.create_repo(
             my_sql_connection_pool
         )
         self.turbo_sms_repo = TurboSMSRepo(
-            turbo_sms_config=turbo_sms_config, sender=sender, use_sso=use_sso
+            turbo_sms_config=turbo_sms_config,
+            sender=sender,
+            use_sso=use_sso,
+            rate_limit_url=celery_broker_url,
         )
         self.notify_repo = await NotifyRepo.create_repo(
             db_connection=mongo_db_connection
@@ -103,6 +202,15 @@ class NotifyService(BaseService):
         self.message_repo = await MessageRepo.create_repo(
             db_connection=mongo_db_connection
         )
+        self.dead_letter_message_repo = await DeadLetterMessageRepo.create_repo(
+            db_connection=mongo_db_connection
+        )
+        self.notify_outbox_repo = await NotifyOutboxRepo.create_repo(
+            db_connection=mongo_db_connection
+        )
+        self.notify_attachment_repo = await NotifyAttachmentRepo.create_repo(
+            db_connection=mongo_db_connection
+        )
         self.users_billing_repo = await UsersBillingRepo.create_repo(
             my_sql_connection_pool
         )
@@ -113,13 +221,22 @@ class NotifyService(BaseService):
             use_sso=use_sso,
             bot_token=bot_token,
             billing_group_chat_id=billing_group_chat_id,
+            telegram_config=telegram_config,
+            rate_limit_url=celery_broker_url,
         )
+        self.notify_tasks_repo = NotifyTasksRepo(broker_url=celery_broker_url)
 
         return self
 
+    async def warm_up(self) -> None:
+        await self.turbo_sms_repo.warm_up()
+
+    async def close(self) -> None:
+        await self.telegram_notify_repo.close()
+        await self.turbo_sms_repo.close()
+
     async def validate_update_file(self, update_file: UploadFile) -> None:
-        # 16 MB
-        if update_file.size > 16 * 1024 * 1024:
+        if update_file.size > self.notify_upload_max_size:
             raise ServiceError(message="File too large.")
         lm = magic.Magic(mime=True, uncompress=False)
         await update_file.seek(0)
@@ -134,171 +251,898 @@ class NotifyService(BaseService):
         self, update_file: UploadFile
     ) -> DictReader:
         await self.validate_update_file(update_file)
-        return csv.DictReader(StringIO((await update_file.read()).decode("utf-8")))
+        # Decode the spooled upload incrementally instead of reading it whole.
+        return csv.DictReader(
+            TextIOWrapper(update_file.file, encoding="utf-8", newline="")
+        )
 
-    async def send_sms_by_file(
-        self, sms_file: UploadFile, message_text: str, user_uuid, username
-    ) -> str:
-        csv_reader = await self._get_csv_reader_from_update_file(update_file=sms_file)
-        if csv_reader.fieldnames is None:
+    def _read_user_billing_messages_data(
+        self, csv_reader: DictReader
+    ) -> Iterator[list[UserBillingRow]]:
+        if not has_user_billing_columns(fieldnames=csv_reader.fieldnames):
             raise ServiceError(message="File must contain id and phone_number columns.")
-        repeated_phone_numbers = []
-        with open(self.user_notify_report, mode="w") as csvfile:
-            writer = csv.DictWriter(
-                csvfile, fieldnames=[*csv_reader.fieldnames, "Статус відправки"]
-            )
-            writer.writeheader()
-            user_billing_messages_data = []
-            for row in csv_reader:
-                try:
-                    message = UserBillingMessageData(**row)
-                except ValidationError:
-                    raise ServiceError(
-                        message="File must contain id and phone_number columns."
-                    )
-                if message.phone_number in repeated_phone_numbers:
-                    message.status = MessageStatus.PHONE_NUMBER_IS_REPEATED
-                repeated_phone_numbers.append(message.phone_number)
+        # Row numbers match the spreadsheet view of the file, the header is row 1.
+        row_number = 1
+        for rows in read_csv_in_chunks(
+            csv_reader=csv_reader, chunk_size=self.CSV_CHUNK_SIZE
+        ):
+            try:
+                user_billing_messages_data = validate_user_billing_rows(
+                    rows=rows, first_row_number=row_number + 1
+                )
+            except ValueError:
+                raise ServiceError(
+                    message="File must contain id and phone_number columns."
+                )
+            row_number += len(rows)
+            yield user_billing_messages_data
+
+    @staticmethod
+    def _check_repeated_phone_number(
+        mes: UserBillingRow, phone_numbers_rows: dict[str, int]
+    ) -> None:
+        if mes.status != MessageStatus.PENDING:
+            return
+        row_number = phone_numbers_rows.setdefault(
+            mes.normalized_phone_number, mes.row_number
+        )
+        if row_number != mes.row_number:
+            mes.status = MessageStatus.PHONE_NUMBER_IS_REPEATED
+            mes.repeated_row_number = row_number
+
+    async def _get_telegram_chat_ids_maps(
+        self, user_billing_messages_data: list[UserBillingRow]
+    ) -> tuple[dict[int, int], dict[str, int]]:
+        phone_numbers = set()
+        for mes in user_billing_messages_data:
+            phone_numbers.add(mes.phone_number)
+            if mes.normalized_phone_number is not None:
+                phone_numbers.add(mes.normalized_phone_number)
+                phone_numbers.add(mes.normalized_phone_number.lstrip("+"))
+        telegram_users = await self.telegram_users_repo.get_list(
+            phone_numbers=list(phone_numbers),
+            billing_ids=[mes.id for mes in user_billing_messages_data],
+        )
+        map_billing_id_to_chat_id = {
+            user.billing_id: user.chat_id for user in telegram_users
+        }
+        map_phone_number_to_chat_id = {}
+        for user in telegram_users:
+            normalized_phone_number = normalize_phone_number(user.phone_number)
+            if normalized_phone_number is not None:
+                map_phone_number_to_chat_id[normalized_phone_number] = user.chat_id
+        return map_billing_id_to_chat_id, map_phone_number_to_chat_id
 
-                user_billing_messages_data.append(message)
-                writer.writerow({**row, "Статус відправки": message.status})
+    async def _get_sms_recipients_count(
+        self, sms_file: UploadFile, message_text: str
+    ) -> int:
+        csv_reader = await self._get_csv_reader_from_update_file(update_file=sms_file)
+        message_hash = self._get_message_hash(text=message_text)
+        recipients = set()
         try:
-            async with self.notify_repo.start_transaction() as session:
-                notify = await self.notify_repo.save_notify(
-                    notify=Notify(
-                        message=message_text,
-                        user_uuid=user_uuid,
-                        username=username,
-                        sent_by=NotifyServices.SMS,
-                    ),
-                    session=session,
+            for user_billing_messages_data in self._read_user_billing_messages_data(
+                csv_reader=csv_reader
+            ):
+                phone_numbers = {
+                    mes.normalized_phone_number
+                    for mes in user_billing_messages_data
+                    if mes.status == MessageStatus.PENDING
+                } - recipients
+                recipients.update(phone_numbers)
+                recipients.difference_update(
+                    await self._get_recently_sent_phone_numbers(
+                        phone_numbers=list(phone_numbers), message_hash=message_hash
+                    )
                 )
-                messages = await self.message_repo.bulk_save_messages(
-                    messages=[
+        finally:
+            await sms_file.close()
+        return len(recipients)
+
+    async def get_sms_preview(
+        self, message_text: str, sms_file: UploadFile | None = None
+    ) -> dict:
+        sms_segments = get_sms_segments(message_text)
+        recipients = 0
+        if sms_file is not None:
+            recipients = await self._get_sms_recipients_count(
+                sms_file=sms_file, message_text=message_text
+            )
+        return {
+            "encoding": sms_segments.encoding,
+            "length": sms_segments.length,
+            "segments": sms_segments.segments,
+            "recipients": recipients,
+            "total_segments": sms_segments.segments * recipients,
+            "estimated_cost": self.turbo_sms_repo.get_sms_cost(
+                segments_count=sms_segments.segments * recipients
+            ),
+            "balance": await self._get_cached_sms_balance(),
+        }
+
+    async def send_sms_by_file(
+        self, sms_file: UploadFile, message_text: str, user_uuid, username
+    ) -> Notify:
+        csv_reader = await self._get_csv_reader_from_update_file(update_file=sms_file)
+        notify = Notify(
+            message=message_text,
+            user_uuid=user_uuid,
+            username=username,
+            sent_by=NotifyServices.SMS,
+        )
+
+        async def get_messages_batches() -> AsyncIterator[list[Message]]:
+            phone_numbers_rows = {}
+            for user_billing_messages_data in self._read_user_billing_messages_data(
+                csv_reader=csv_reader
+            ):
+                messages = []
+                for mes in user_billing_messages_data:
+                    self._check_repeated_phone_number(
+                        mes=mes, phone_numbers_rows=phone_numbers_rows
+                    )
+                    messages.append(
                         Message(
                             user_id=mes.id,
                             phone_number=mes.phone_number,
+                            normalized_phone_number=mes.normalized_phone_number,
+                            row_number=mes.row_number,
+                            repeated_row_number=mes.repeated_row_number,
                             notify_uuid=notify.uuid,
+                            channel=NotifyServices.SMS,
                             status=mes.status,
                         )
-                        for mes in user_billing_messages_data
-                    ],
-                    session=session,
-                )
-                res = await self.turbo_sms_repo.send_billing_user_sms(
-                    phonenumbers=[
-                        message.phone_number
-                        for message in messages
-                        if message.status == MessageStatus.SANDED
-                    ],
-                    text=message_text,
-                )
-                if res is not True:
-                    raise ServiceError(message="Unexpected Error. Please try again.")
-        except Exception as e:
-            logger.error("Unexpected Error.")
-            logger.error(str(e))
-            raise ServiceError(message="Unexpected Error. Please try again.")
-        await sms_file.close()
-        return self.user_notify_report
+                    )
+                await self._suppress_duplicate_sms(messages=messages, text=message_text)
+                yield messages
+
+        try:
+            return await self._create_notify(
+                notify=notify, messages_batches=get_messages_batches()
+            )
+        finally:
+            await sms_file.close()
+
+    @staticmethod
+    def _get_message_hash(text: str) -> str:
+        return hashlib.sha256(text.encode()).hexdigest()
+
+    async def _get_recently_sent_phone_numbers(
+        self, phone_numbers: list[str], message_hash: str
+    ) -> set[str]:
+        window = self.turbo_sms_repo.duplicate_window
+        if not window or not phone_numbers:
+            return set()
+        sent_phone_numbers = await self.message_repo.get_recently_sent_phone_numbers(
+            phone_numbers=phone_numbers,
+            message_hash=message_hash,
+            sent_after=datetime.now() - timedelta(seconds=window),
+            statuses=self.SMS_SENT_STATUSES,
+        )
+        if not sent_phone_numbers:
+            return set()
+        # Messages are stored before their notify, so rows left by an upload
+        # that failed have no notify and were never sent.
+        notify_uuids = await self.notify_repo.get_existing_uuids(
+            notify_uuids=list(set().union(*sent_phone_numbers.values()))
+        )
+        return {
+            phone_number
+            for phone_number, phone_number_notify_uuids in sent_phone_numbers.items()
+            if phone_number_notify_uuids & notify_uuids
+        }
+
+    async def _suppress_duplicate_sms(self, messages: list[Message], text: str) -> None:
+        message_hash = self._get_message_hash(text=text)
+        for message in messages:
+            message.message_hash = message_hash
+        sent_phone_numbers = await self._get_recently_sent_phone_numbers(
+            phone_numbers=list(
+                {
+                    message.normalized_phone_number
+                    for message in messages
+                    if message.status == MessageStatus.PENDING
+                    and message.normalized_phone_number is not None
+                }
+            ),
+            message_hash=message_hash,
+        )
+        for message in messages:
+            if (
+                message.status == MessageStatus.PENDING
+                and message.normalized_phone_number in sent_phone_numbers
+            ):
+                message.status = MessageStatus.DUPLICATE_SUPPRESSED
+        if sent_phone_numbers:
+            logger.info(
+                "Suppressed %s duplicate SMS sent within %s seconds",
+                len(sent_phone_numbers),
+                self.turbo_sms_repo.duplicate_window,
+            )
+
+    async def _get_notify_attachment(
+        self, attachment_file: UploadFile, notify: Notify
+    ) -> NotifyAttachment:
+        if attachment_file.size > self.MAX_ATTACHMENT_SIZE:
+            raise ServiceError(message="Attachment too large.")
+        if len(notify.message) > self.MAX_CAPTION_LENGTH:
+            raise ServiceError(
+                message=f"Message with attachment must be up to "
+                f"{self.MAX_CAPTION_LENGTH} characters."
+            )
+        content = await attachment_file.read()
+        await attachment_file.close()
+        content_type = magic.Magic(mime=True, uncompress=False).from_buffer(
+            content[:2048]
+        )
+        if content_type not in self.ATTACHMENT_TYPES:
+            raise ServiceError(
+                message=f"Attachment must be an image or pdf. "
+                f"Yor format is {content_type}."
+            )
+        notify.attachment_type = self.ATTACHMENT_TYPES[content_type]
+        return NotifyAttachment(
+            notify_uuid=notify.uuid,
+            filename=attachment_file.filename or notify.attachment_type,
+            content_type=content_type,
+            content=content,
+        )
 
     async def send_telegram_notify_by_file(
-        self, telegram_notify_file: UploadFile, message_text: str, user_uuid, username
-    ):
+        self,
+        telegram_notify_file: UploadFile,
+        message_text: str,
+        user_uuid,
+        username,
+        attachment_file: UploadFile | None = None,
+    ) -> Notify:
         csv_reader = await self._get_csv_reader_from_update_file(
             update_file=telegram_notify_file
         )
         if csv_reader.fieldnames is None:
             raise ServiceError(message="File must contain id and phone_number columns.")
-        user_billing_messages_data = []
-        valid_phone_numbers = []
-        user_billing_ids = []
-        list_csv_reader = list(csv_reader)
-        for row in list_csv_reader:
-            try:
-                message = UserBillingMessageData(**row)
-            except ValidationError:
-                raise ServiceError(
-                    message="File must contain id and phone_number columns."
+        notify = Notify(
+            message=message_text,
+            user_uuid=user_uuid,
+            username=username,
+            sent_by=NotifyServices.TELEGRAM,
+        )
+        attachment = None
+        if attachment_file is not None:
+            attachment = await self._get_notify_attachment(
+                attachment_file=attachment_file, notify=notify
+            )
+
+        async def get_messages_batches() -> AsyncIterator[list[Message]]:
+            for user_billing_messages_data in self._read_user_billing_messages_data(
+                csv_reader=csv_reader
+            ):
+                (
+                    map_billing_id_to_chat_id,
+                    map_phone_number_to_chat_id,
+                ) = await self._get_telegram_chat_ids_maps(
+                    user_billing_messages_data=user_billing_messages_data
                 )
-            user_billing_messages_data.append(message)
-            valid_phone_numbers.append(message.phone_number)
-            user_billing_ids.append(message.id)
-        telegram_users = await self.telegram_users_repo.get_list(
-            phone_numbers=valid_phone_numbers, billing_ids=user_billing_ids
+                yield [
+                    Message(
+                        user_id=mes.id,
+                        phone_number=mes.phone_number,
+                        normalized_phone_number=mes.normalized_phone_number,
+                        row_number=mes.row_number,
+                        notify_uuid=notify.uuid,
+                        telegram_chat_id=map_billing_id_to_chat_id.get(mes.id)
+                        or map_phone_number_to_chat_id.get(mes.normalized_phone_number),
+                        channel=NotifyServices.TELEGRAM,
+                        status=MessageStatus.PENDING
+                        if mes.id in map_billing_id_to_chat_id.keys()
+                        or mes.normalized_phone_number
+                        in map_phone_number_to_chat_id.keys()
+                        else MessageStatus.NOT_REGISTERED_TELEGRAM,
+                    )
+                    for mes in user_billing_messages_data
+                ]
+
+        try:
+            return await self._create_notify(
+                notify=notify,
+                attachment=attachment,
+                messages_batches=get_messages_batches(),
+            )
+        finally:
+            await telegram_notify_file.close()
+
+    async def send_multi_channel_notify_by_file(
+        self, notify_file: UploadFile, message_text: str, user_uuid, username
+    ) -> Notify:
+        csv_reader = await self._get_csv_reader_from_update_file(
+            update_file=notify_file
         )
-        map_billing_id_to_chat_id = {
-            user.billing_id: user.chat_id for user in telegram_users
-        }
-        map_phone_number_to_chat_id = {
-            user.phone_number.replace("+", ""): user.chat_id for user in telegram_users
-        }
+        notify = Notify(
+            message=message_text,
+            user_uuid=user_uuid,
+            username=username,
+            sent_by=NotifyServices.MULTI_CHANNEL,
+        )
+
+        async def get_messages_batches() -> AsyncIterator[list[Message]]:
+            phone_numbers_rows = {}
+            for user_billing_messages_data in self._read_user_billing_messages_data(
+                csv_reader=csv_reader
+            ):
+                (
+                    map_billing_id_to_chat_id,
+                    map_phone_number_to_chat_id,
+                ) = await self._get_telegram_chat_ids_maps(
+                    user_billing_messages_data=user_billing_messages_data
+                )
+                messages = []
+                for mes in user_billing_messages_data:
+                    message = Message(
+                        user_id=mes.id,
+                        phone_number=mes.phone_number,
+                        normalized_phone_number=mes.normalized_phone_number,
+                        row_number=mes.row_number,
+                        notify_uuid=notify.uuid,
+                        telegram_chat_id=map_billing_id_to_chat_id.get(mes.id)
+                        or map_phone_number_to_chat_id.get(mes.normalized_phone_number),
+                        channel=NotifyServices.TELEGRAM,
+                        status=MessageStatus.PENDING,
+                    )
+                    if message.telegram_chat_id is None:
+                        self._check_repeated_phone_number(
+                            mes=mes, phone_numbers_rows=phone_numbers_rows
+                        )
+                        message.channel = NotifyServices.SMS
+                        message.status = mes.status
+                        message.repeated_row_number = mes.repeated_row_number
+                    messages.append(message)
+                yield messages
+
         try:
+            return await self._create_notify(
+                notify=notify, messages_batches=get_messages_batches()
+            )
+        finally:
+            await notify_file.close()
+
+    async def _create_notify(
+        self,
+        notify: Notify,
+        messages_batches: AsyncIterator[list[Message]],
+        attachment: NotifyAttachment | None = None,
+    ) -> Notify:
+        # Messages are saved batch by batch as the upload is parsed, so the
+        # whole file is never held in memory. The notify and its outbox are
+        # only saved once every batch is stored.
+        pending_count = 0
+        sms_pending_count = 0
+        try:
+            if attachment is not None:
+                await self.notify_attachment_repo.save_attachment(attachment=attachment)
+            async for messages in messages_batches:
+                for message in messages:
+                    if message.status != MessageStatus.PENDING:
+                        continue
+                    message.chunk = pending_count // self.notify_chunk_size
+                    pending_count += 1
+                    if message.channel == NotifyServices.SMS:
+                        sms_pending_count += 1
+                await self.message_repo.bulk_save_messages(messages=messages)
+            # Multi-channel rows that fall back to SMS only after a failed
+            # Telegram send are not known here and are not part of the estimate.
+            await self._check_sms_balance(
+                text=notify.message, recipients_count=sms_pending_count
+            )
+            notify.chunks_count = ceil(pending_count / self.notify_chunk_size)
+            if notify.chunks_count == 0:
+                notify.status = NotifyStatus.FINISHED
+            outbox = [
+                NotifyOutbox(notify_uuid=notify.uuid, chunk=chunk)
+                for chunk in range(notify.chunks_count)
+            ]
             async with self.notify_repo.start_transaction() as session:
                 notify = await self.notify_repo.save_notify(
-                    notify=Notify(
-                        message=message_text,
-                        user_uuid=user_uuid,
-                        username=username,
-                        sent_by=NotifyServices.TELEGRAM,
-                    ),
-                    session=session,
-                )
-                messages = await self.message_repo.bulk_save_messages(
-                    messages=[
-                        Message(
-                            user_id=mes.id,
-                            phone_number=mes.phone_number,
-                            notify_uuid=notify.uuid,
-                            telegram_chat_id=map_billing_id_to_chat_id.get(mes.id)
-                            or map_phone_number_to_chat_id.get(mes.phone_number),
-                            status=MessageStatus.SANDED
-                            if mes.id in map_billing_id_to_chat_id.keys()
-                            or mes.phone_number in map_phone_number_to_chat_id.keys()
-                            else MessageStatus.NOT_REGISTERED_TELEGRAM,
-                        )
-                        for mes in user_billing_messages_data
-                    ],
-                    session=session,
+                    notify=notify, session=session
                 )
-                res = await self.telegram_notify_repo.send_telegram_users_messages(
-                    chat_ids=[
-                        message.telegram_chat_id
-                        for message in messages
-                        if message.status == MessageStatus.SANDED
-                        and message.telegram_chat_id is not None
-                    ],
-                    text=message_text,
+                await self.notify_outbox_repo.bulk_save_outbox(
+                    outbox=outbox, session=session
                 )
-                if res is not True:
-                    raise ServiceError(message="Unexpected Error. Please try again.")
         except Exception as e:
+            await self.message_repo.delete_notify_messages(notify_uuid=notify.uuid)
+            await self.notify_attachment_repo.delete_attachment(notify_uuid=notify.uuid)
+            if isinstance(e, ServiceError):
+                raise e
             logger.error("Unexpected Error.")
             logger.error(str(e))
             raise ServiceError(message="Unexpected Error. Please try again.")
-        with open(self.user_notify_report, mode="w") as csvfile:
-            writer = csv.DictWriter(
-                csvfile, fieldnames=[*csv_reader.fieldnames, "Статус відправки"]
+        self._enqueue_outbox(outbox=outbox)
+        return notify
+
+    async def _get_cached_sms_balance(self) -> float | None:
+        try:
+            return await self.turbo_sms_repo.get_current_balance()
+        except Exception:
+            logger.exception("TurboSMS balance is unknown")
+            return None
+
+    async def _check_sms_balance(self, text: str, recipients_count: int) -> None:
+        if recipients_count == 0:
+            return
+        balance = await self._get_cached_sms_balance()
+        if balance is None:
+            return
+        cost = self.turbo_sms_repo.get_sms_cost(
+            segments_count=get_sms_segments(text).segments * recipients_count
+        )
+        if cost > balance:
+            raise ServiceError(
+                message=f"Not enough TurboSMS balance. "
+                f"Campaign cost is {cost:.2f}, balance is {balance:.2f}."
             )
-            writer.writeheader()
-            for row in list_csv_reader:
-                if (
-                    int(row.get("Абонент ID")) in map_billing_id_to_chat_id.keys()
-                    or row.get("Номер телефону").replace("+", "")
-                    in map_phone_number_to_chat_id.keys()
-                ):
-                    writer.writerow({**row, "Статус відправки": MessageStatus.SANDED})
-                else:
-                    writer.writerow(
-                        {
-                            **row,
-                            "Статус відправки": MessageStatus.NOT_REGISTERED_TELEGRAM,
-                        }
-                    )
-        return self.user_notify_report
+
+    def _enqueue_outbox(
+        self, outbox: list[NotifyOutbox], countdown: float | None = None
+    ) -> None:
+        for entry in outbox:
+            try:
+                self.notify_tasks_repo.send_notify_chunk(
+                    notify_uuid=entry.notify_uuid,
+                    chunk=entry.chunk,
+                    countdown=countdown,
+                )
+            except Exception:
+                logger.exception(
+                    "Notify chunk enqueue failed, outbox dispatcher will retry it"
+                )
+
+    async def send_notify_chunk(self, notify_uuid: UUID, chunk: int) -> None:
+        outbox_entry = await self.notify_outbox_repo.claim(
+            notify_uuid=notify_uuid,
+            chunk=chunk,
+            lease_expired_at=datetime.now() - self.NOTIFY_OUTBOX_LEASE,
+        )
+        if outbox_entry is None:
+            return
+        notify = await self.notify_repo.retrieve(notify_uuid=notify_uuid)
+        if notify.status == NotifyStatus.CREATED:
+            await self.notify_repo.update_status(
+                notify_uuid=notify_uuid, status=NotifyStatus.IN_PROGRESS
+            )
+        interrupted_count = await self.message_repo.mark_interrupted(
+            notify_uuid=notify_uuid, chunk=chunk
+        )
+        if interrupted_count:
+            logger.warning(
+                "Notify %s chunk %s: %s messages were interrupted and won't be resent",
+                notify_uuid,
+                chunk,
+                interrupted_count,
+            )
+        media = None
+        if notify.attachment_type is not None:
+            media = await self._get_notify_media(notify=notify)
+        provider_repos = self._get_provider_repos(notify=notify)
+        checkpoint_size = self._get_checkpoint_size(notify=notify)
+        cancelled = notify.status == NotifyStatus.CANCELLED
+        while (
+            not cancelled
+            and all(provider_repo.is_available for provider_repo in provider_repos)
+            and (
+                messages := await self.message_repo.claim_chunk_messages(
+                    notify_uuid=notify_uuid,
+                    chunk=chunk,
+                    limit=checkpoint_size,
+                )
+            )
+        ):
+            await self._send_messages(notify=notify, messages=messages, media=media)
+            cancelled = await self.notify_repo.is_cancelled(notify_uuid=notify_uuid)
+            if cancelled:
+                for message in messages:
+                    if message.status in (
+                        MessageStatus.PENDING,
+                        MessageStatus.RETRYING,
+                    ):
+                        message.status = MessageStatus.CANCELLED
+                        message.next_attempt_at = None
+            dead_letters = self._get_dead_letters(notify=notify, messages=messages)
+            if dead_letters:
+                await self.dead_letter_message_repo.bulk_save_dead_letters(
+                    dead_letters=dead_letters
+                )
+            if media is not None and notify.attachment_file_id != media.file_id:
+                notify.attachment_file_id = media.file_id
+                await self.notify_repo.set_attachment_file_id(
+                    notify_uuid=notify_uuid, file_id=media.file_id
+                )
+            await self.message_repo.bulk_update_statuses(messages=messages)
+            await self.notify_outbox_repo.save_checkpoint(
+                outbox_uuid=outbox_entry.uuid, dispatched_count=len(messages)
+            )
+        if cancelled:
+            logger.info("Notify %s chunk %s: notify is cancelled", notify_uuid, chunk)
+            await self.notify_outbox_repo.mark_done(outbox_uuid=outbox_entry.uuid)
+            return
+        if not all(provider_repo.is_available for provider_repo in provider_repos):
+            logger.warning(
+                "Notify %s chunk %s: %s is unavailable, chunk is deferred",
+                notify_uuid,
+                chunk,
+                notify.sent_by,
+            )
+            await self.notify_outbox_repo.defer(outbox_uuid=outbox_entry.uuid)
+            return
+        next_attempt_at = await self.message_repo.get_next_attempt_at(
+            notify_uuid=notify_uuid, chunk=chunk
+        )
+        if next_attempt_at is not None:
+            await self.notify_outbox_repo.defer(
+                outbox_uuid=outbox_entry.uuid, enqueued_at=next_attempt_at
+            )
+            self._enqueue_outbox(
+                outbox=[outbox_entry],
+                countdown=max((next_attempt_at - datetime.now()).total_seconds(), 0),
+            )
+            return
+        await self.notify_outbox_repo.mark_done(outbox_uuid=outbox_entry.uuid)
+        unfinished_count = await self.notify_outbox_repo.get_unfinished_count(
+            notify_uuid=notify_uuid
+        )
+        await self.notify_repo.update_progress(
+            notify_uuid=notify_uuid,
+            finished_chunks_count=notify.chunks_count - unfinished_count,
+            unfinished_count=unfinished_count,
+        )
+
+    async def cancel_notify(self, notify_uuid: UUID) -> Notify:
+        notify = await self.notify_repo.retrieve(notify_uuid=notify_uuid)
+        if not await self.notify_repo.cancel(notify_uuid=notify_uuid):
+            raise ServiceError(message="Notify is already finished.")
+        cancelled_count = await self.message_repo.cancel_unsent(notify_uuid=notify_uuid)
+        await self.notify_outbox_repo.cancel(notify_uuid=notify_uuid)
+        logger.info(
+            "Notify %s is cancelled, %s messages won't be sent",
+            notify_uuid,
+            cancelled_count,
+        )
+        notify.status = NotifyStatus.CANCELLED
+        return notify
+
+    async def resume_notify(self, notify_uuid: UUID) -> Notify:
+        notify = await self.notify_repo.retrieve(notify_uuid=notify_uuid)
+        if notify.status == NotifyStatus.CANCELLED:
+            raise ServiceError(message="Notify is cancelled.")
+        outbox = await self.notify_outbox_repo.release_unfinished(
+            notify_uuid=notify_uuid,
+            lease_expired_at=datetime.now() - self.NOTIFY_OUTBOX_LEASE,
+        )
+        if not outbox:
+            if await self.notify_outbox_repo.get_unfinished_count(
+                notify_uuid=notify_uuid
+            ):
+                raise ServiceError(message="Notify is already being sent.")
+            raise ServiceError(message="Notify is already finished.")
+        logger.info("Resuming notify %s, %s chunks left", notify_uuid, len(outbox))
+        self._enqueue_outbox(outbox=outbox)
+        return notify
+
+    async def replay_dead_letters(self, notify_uuid: UUID | None = None) -> int:
+        dead_letters = await self.dead_letter_message_repo.get_not_replayed_list(
+            notify_uuid=notify_uuid, limit=self.DEAD_LETTERS_REPLAY_LIMIT
+        )
+        notifies = {
+            dead_letter_notify_uuid: await self.notify_repo.retrieve(
+                notify_uuid=dead_letter_notify_uuid
+            )
+            for dead_letter_notify_uuid in {
+                dead_letter.notify_uuid for dead_letter in dead_letters
+            }
+        }
+        dead_letters = [
+            dead_letter
+            for dead_letter in dead_letters
+            if notifies[dead_letter.notify_uuid].status != NotifyStatus.CANCELLED
+        ]
+        if not dead_letters:
+            return 0
+        await self.message_repo.reset_for_replay(
+            message_uuids=[dead_letter.message_uuid for dead_letter in dead_letters]
+        )
+        await self.dead_letter_message_repo.mark_replayed(
+            dead_letter_uuids=[dead_letter.uuid for dead_letter in dead_letters]
+        )
+        notify_chunks = defaultdict(set)
+        for dead_letter in dead_letters:
+            notify_chunks[dead_letter.notify_uuid].add(dead_letter.chunk)
+        for replay_notify_uuid, chunks in notify_chunks.items():
+            outbox = await self.notify_outbox_repo.reopen(
+                notify_uuid=replay_notify_uuid, chunks=list(chunks)
+            )
+            notify = notifies[replay_notify_uuid]
+            unfinished_count = await self.notify_outbox_repo.get_unfinished_count(
+                notify_uuid=replay_notify_uuid
+            )
+            await self.notify_repo.reopen(
+                notify_uuid=replay_notify_uuid,
+                finished_chunks_count=notify.chunks_count - unfinished_count,
+            )
+            self._enqueue_outbox(outbox=outbox)
+        logger.info("Replaying %s dead letter messages", len(dead_letters))
+        return len(dead_letters)
+
+    async def dispatch_notify_outbox(self) -> None:
+        now = datetime.now()
+        outbox = await self.notify_outbox_repo.get_stale_list(
+            enqueued_before=now - self.NOTIFY_OUTBOX_REDELIVERY_DELAY,
+            lease_expired_at=now - self.NOTIFY_OUTBOX_LEASE,
+            limit=1000,
+        )
+        if not outbox:
+            return
+        logger.info("Redelivering %s notify outbox chunks", len(outbox))
+        await self.notify_outbox_repo.mark_enqueued(
+            outbox_uuids=[entry.uuid for entry in outbox]
+        )
+        self._enqueue_outbox(outbox=outbox)
+
+    def _get_provider_repos(
+        self, notify: Notify
+    ) -> list[TelegramNotifyRepo | TurboSMSRepo]:
+        if notify.sent_by == NotifyServices.SMS:
+            return [self.turbo_sms_repo]
+        if notify.sent_by == NotifyServices.TELEGRAM:
+            return [self.telegram_notify_repo]
+        return [self.telegram_notify_repo, self.turbo_sms_repo]
+
+    def _get_checkpoint_size(self, notify: Notify) -> int:
+        # A smaller SMS batch would leave provider requests unused, so it is
+        # sized to fill every concurrent request.
+        if notify.sent_by == NotifyServices.SMS:
+            return max(self.notify_checkpoint_size, self.turbo_sms_repo.send_batch_size)
+        return self.notify_checkpoint_size
+
+    async def _send_messages(
+        self, notify: Notify, messages: list[Message], media: TelegramMedia | None
+    ) -> None:
+        telegram_messages = [
+            message
+            for message in messages
+            if (message.channel or notify.sent_by) == NotifyServices.TELEGRAM
+        ]
+        sms_messages = [
+            message
+            for message in messages
+            if (message.channel or notify.sent_by) == NotifyServices.SMS
+        ]
+        if telegram_messages:
+            await self._send_telegram_messages(
+                messages=telegram_messages, text=notify.message, media=media
+            )
+        if notify.sent_by == NotifyServices.MULTI_CHANNEL:
+            sms_messages.extend(
+                await self._get_sms_fallback_messages(
+                    notify=notify,
+                    telegram_messages=telegram_messages,
+                    sms_messages=sms_messages,
+                )
+            )
+        if sms_messages:
+            await self._send_sms_messages(messages=sms_messages, text=notify.message)
+
+    async def _get_sms_fallback_messages(
+        self,
+        notify: Notify,
+        telegram_messages: list[Message],
+        sms_messages: list[Message],
+    ) -> list[Message]:
+        fallback_messages = {}
+        for message in telegram_messages:
+            if (
+                message.status in self.SMS_FALLBACK_STATUSES
+                and message.normalized_phone_number is not None
+            ):
+                fallback_messages.setdefault(message.normalized_phone_number, message)
+        if not fallback_messages:
+            return []
+        sms_phone_numbers = {
+            message.normalized_phone_number for message in sms_messages
+        }
+        sms_phone_numbers.update(
+            await self.message_repo.get_notify_sms_phone_numbers(
+                notify_uuid=notify.uuid,
+                phone_numbers=list(fallback_messages),
+                statuses=self.SMS_SENT_STATUSES,
+            )
+        )
+        messages = []
+        for phone_number, message in fallback_messages.items():
+            if phone_number in sms_phone_numbers:
+                continue
+            message.channel = NotifyServices.SMS
+            message.attempts = 0
+            message.error_code = None
+            messages.append(message)
+        return messages
+
+    async def _send_sms_messages(self, messages: list[Message], text: str) -> None:
+        for message in messages:
+            if message.normalized_phone_number is None:
+                message.status = MessageStatus.NOT_VALID_PHONE_NUMBER
+        messages = [message for message in messages if message.normalized_phone_number]
+        if not messages:
+            return
+        results = await self.turbo_sms_repo.send_billing_user_sms(
+            phonenumbers=[message.normalized_phone_number for message in messages],
+            text=text,
+        )
+        for message in messages:
+            result = results[message.normalized_phone_number]
+            if result.circuit_open:
+                message.status = MessageStatus.PENDING
+            elif result.transient:
+                self._schedule_retry(
+                    message=message, rate_limited=result.error_code == 429
+                )
+            elif result.ok:
+                message.status = MessageStatus.SANDED
+            else:
+                message.status = MessageStatus.FAILED
+            message.error_code = result.error_code
+            message.error_description = result.description
+            message.provider_message_id = result.message_id
+
+    async def poll_sms_delivery_statuses(self) -> None:
+        now = datetime.now()
+        polled_count = 0
+        while polled_count < self.SMS_DELIVERY_POLL_LIMIT and (
+            messages := await self.message_repo.get_delivery_pending_list(
+                dispatched_after=now - self.SMS_DELIVERY_POLL_PERIOD,
+                checked_before=now - self.SMS_DELIVERY_POLL_INTERVAL,
+                limit=self.SMS_DELIVERY_POLL_BATCH_SIZE,
+            )
+        ):
+            statuses = await self.turbo_sms_repo.get_messages_statuses(
+                message_ids=[message.provider_message_id for message in messages]
+            )
+            for message in messages:
+                delivery_status = statuses[message.provider_message_id]
+                message.delivery_checked_at = datetime.now()
+                if delivery_status is None:
+                    continue
+                message.delivery_status = delivery_status
+                message.status = self._get_sms_delivery_message_status(
+                    delivery_status=delivery_status
+                )
+            await self.message_repo.bulk_update_delivery_statuses(messages=messages)
+            polled_count += len(messages)
+        if polled_count:
+            logger.info("Polled delivery statuses of %s SMS", polled_count)
+
+    def _get_sms_delivery_message_status(self, delivery_status: str) -> MessageStatus:
+        delivery_status = delivery_status.lower()
+        for marker, status in self.SMS_DELIVERY_STATUSES:
+            if marker in delivery_status:
+                return status
+        return MessageStatus.SANDED
+
+    def _schedule_retry(self, message: Message, rate_limited: bool = False) -> None:
+        message.attempts += 1
+        if message.attempts >= self.notify_retry_config.max_attempts:
+            message.status = (
+                MessageStatus.RATE_LIMITED
+                if rate_limited
+                else MessageStatus.DEAD_LETTER
+            )
+            message.next_attempt_at = None
+            return
+        delay = get_backoff_delay(
+            attempt=message.attempts,
+            base_delay=self.notify_retry_config.base_delay,
+            max_delay=self.notify_retry_config.max_delay,
+        )
+        message.status = MessageStatus.RETRYING
+        message.next_attempt_at = datetime.now() + timedelta(seconds=delay)
+
+    @classmethod
+    def _get_dead_letters(
+        cls, notify: Notify, messages: list[Message]
+    ) -> list[DeadLetterMessage]:
+        return [
+            DeadLetterMessage(
+                message_uuid=message.uuid,
+                notify_uuid=message.notify_uuid,
+                chunk=message.chunk,
+                sent_by=message.channel or notify.sent_by,
+                user_id=message.user_id,
+                phone_number=message.phone_number,
+                telegram_chat_id=message.telegram_chat_id,
+                attempts=message.attempts,
+                error_code=message.error_code,
+                error_description=message.error_description,
+            )
+            for message in messages
+            if message.status in cls.DEAD_LETTER_STATUSES
+        ]
+
+    async def _get_notify_media(self, notify: Notify) -> TelegramMedia:
+        if notify.attachment_file_id is not None:
+            return TelegramMedia(
+                media_type=notify.attachment_type,
+                filename=notify.attachment_type,
+                content_type="",
+                file_id=notify.attachment_file_id,
+            )
+        attachment = await self.notify_attachment_repo.retrieve(notify_uuid=notify.uuid)
+        return TelegramMedia(
+            media_type=notify.attachment_type,
+            filename=attachment.filename,
+            content_type=attachment.content_type,
+            content=attachment.content,
+        )
+
+    async def _send_telegram_messages(
+        self, messages: list[Message], text: str, media: TelegramMedia | None = None
+    ) -> None:
+        chat_ids = [message.telegram_chat_id for message in messages]
+        if media is None:
+            results = await self.telegram_notify_repo.send_telegram_users_messages(
+                chat_ids=chat_ids, text=text
+            )
+        else:
+            results = await self.telegram_notify_repo.send_telegram_users_media(
+                chat_ids=chat_ids, media=media, caption=text
+            )
+        for message in messages:
+            result = results[message.telegram_chat_id]
+            if result.is_transient:
+                self._schedule_retry(
+                    message=message, rate_limited=result.error_code == 429
+                )
+            else:
+                message.status = self._get_telegram_message_status(result=result)
+            message.error_code = result.error_code
+            message.error_description = result.description
+        unreachable_chats = {
+            chat_id: result.description
+            for chat_id, result in results.items()
+            if result.is_chat_unreachable
+        }
+        if unreachable_chats:
+            await self.telegram_users_repo.mark_unreachable(reasons=unreachable_chats)
+
+    @staticmethod
+    def _get_telegram_message_status(result: TelegramSendResult) -> MessageStatus:
+        if result.circuit_open:
+            return MessageStatus.PENDING
+        if result.ok:
+            return MessageStatus.SANDED
+        if result.is_chat_unreachable:
+            return MessageStatus.BLOCKED
+        return MessageStatus.FAILED
+
+    async def get_notify_job_status(self, notify_uuid: UUID) -> dict:
+        notify = await self.notify_repo.retrieve(notify_uuid=notify_uuid)
+        statuses = await self.message_repo.get_statuses_count(notify_uuid=notify_uuid)
+        return {"notify": notify, "statuses": statuses}
+
+    async def get_providers_health(self) -> dict:
+        circuit_breakers = [
+            await self.telegram_notify_repo.get_circuit_breaker_state(),
+            await self.turbo_sms_repo.get_circuit_breaker_state(),
+        ]
+        return {
+            "status": (
+                "degraded"
+                if any(state["is_open"] for state in circuit_breakers)
+                else "ok"
+            ),
+            "circuit_breakers": circuit_breakers,
+        }
 
     async def get_current_turbo_sms_balance(self):
-        return await self.turbo_sms_repo.get_current_balance()
+        try:
+            return await self.turbo_sms_repo.get_current_balance()
+        except SMSProviderUnavailable:
+            raise ServiceError(message="TurboSMS is unavailable.")
 
     async def get_notifies_list(self, params: NotifyQueryParams):
         count = await self.notify_repo.get_notify_count(username=params.username)
@@ -317,7 +1161,12 @@ class NotifyService(BaseService):
         with open(self.user_notify_report, mode="w") as csvfile:
             writer = csv.DictWriter(
                 csvfile,
-                fieldnames=[*self.USER_NOTIFY_REPORT_FILE_FIELDS, "Статус відправки"],
+                fieldnames=[
+                    *self.USER_NOTIFY_REPORT_FILE_FIELDS,
+                    "Статус відправки",
+                    "Канал відправки",
+                    "Дублікат рядка",
+                ],
             )
             writer.writeheader()
             _filter = UserBillingFilter(ids=list(user_id_message_map.keys()))
@@ -356,6 +1205,17 @@ class NotifyService(BaseService):
                             "Статус відправки": user_id_message_map[user.id].status
                             if user_id_message_map.get(user.id) is not None
                             else "",
+                            "Канал відправки": user_id_message_map[user.id].channel
+                            if user_id_message_map.get(user.id) is not None
+                            and user_id_message_map[user.id].channel is not None
+                            else "",
+                            "Дублікат рядка": user_id_message_map[
+                                user.id
+                            ].repeated_row_number
+                            if user_id_message_map.get(user.id) is not None
+                            and user_id_message_map[user.id].repeated_row_number
+                            is not None
+                            else "",
                         }
                     )
                     for user in users
@@ -395,6 +1255,7 @@ class NotifyService(BaseService):
                 )
                 for message in messages
             ]
+        await self.telegram_notify_repo.flush_billing_group_messages()
 
     async def send_connection_request_notify(
         self, connection_request: TelegramConnectionRequest
@@ -0,0 +1,97 @@
+from dataclasses import dataclass
+from typing import Any, Sequence
+
+import pandas as pd
+import phonenumbers
+
+from src.notify.adapters.models.message import MessageStatus
+from src.notify.adapters.models.user_billing import UserBillingMessageData
+from src.notify.helpers.phone_numbers import DEFAULT_REGION, normalize_phone_number
+
+ID_COLUMN = UserBillingMessageData.model_fields["id"].alias
+PHONE_NUMBER_COLUMN = UserBillingMessageData.model_fields["phone_number"].alias
+
+PHONE_NUMBER_SEPARATORS_PATTERN = r"[\s\-().]"
+UA_PHONE_NUMBER_METADATA = phonenumbers.PhoneMetadata.metadata_for_region(
+    DEFAULT_REGION
+)
+# +380XXXXXXXXX, 380XXXXXXXXX and 0XXXXXXXXX mobile and fixed line numbers are
+# valid for phonenumbers too, so only the values that do not match go through it.
+UA_PHONE_NUMBER_PATTERN = r"^(?:\+?380|0)((?:{})|(?:{}))$".format(
+    UA_PHONE_NUMBER_METADATA.mobile.national_number_pattern,
+    UA_PHONE_NUMBER_METADATA.fixed_line.national_number_pattern,
+)
+
+
+@dataclass(slots=True)
+class UserBillingRow:
+    id: int
+    phone_number: str
+    normalized_phone_number: str | None
+    status: MessageStatus
+    row_number: int
+    repeated_row_number: int | None = None
+
+
+def has_user_billing_columns(fieldnames: Sequence[str] | None) -> bool:
+    return fieldnames is not None and {ID_COLUMN, PHONE_NUMBER_COLUMN}.issubset(
+        fieldnames
+    )
+
+
+def _get_ids(ids: pd.Series) -> pd.Series:
+    ids = pd.to_numeric(ids.str.strip(), errors="coerce")
+    if ids.isna().any() or (ids % 1 != 0).any():
+        raise ValueError("Abonent ID must be an integer.")
+    return ids.astype("int64")
+
+
+def _get_normalized_phone_numbers(phone_numbers: pd.Series) -> pd.Series:
+    cleaned_phone_numbers = phone_numbers.str.strip().str.replace(
+        PHONE_NUMBER_SEPARATORS_PATTERN, "", regex=True
+    )
+    normalized_phone_numbers = "+380" + cleaned_phone_numbers.str.extract(
+        UA_PHONE_NUMBER_PATTERN, expand=False
+    )
+    ambiguous = normalized_phone_numbers.isna() & (cleaned_phone_numbers != "")
+    if ambiguous.any():
+        ambiguous_phone_numbers = phone_numbers[ambiguous]
+        normalized_phone_numbers[ambiguous] = ambiguous_phone_numbers.map(
+            {
+                phone_number: normalize_phone_number(phone_number)
+                for phone_number in ambiguous_phone_numbers.unique()
+            }
+        )
+    return normalized_phone_numbers.astype(object).where(
+        normalized_phone_numbers.notna(), None
+    )
+
+
+def validate_user_billing_rows(
+    rows: list[dict[str, Any]], first_row_number: int
+) -> list[UserBillingRow]:
+    data_frame = pd.DataFrame.from_records(
+        rows, columns=[ID_COLUMN, PHONE_NUMBER_COLUMN]
+    )
+    ids = _get_ids(data_frame[ID_COLUMN])
+    phone_numbers = data_frame[PHONE_NUMBER_COLUMN].fillna("").astype(str)
+    normalized_phone_numbers = _get_normalized_phone_numbers(phone_numbers)
+    return [
+        UserBillingRow(
+            id=user_id,
+            phone_number=phone_number,
+            normalized_phone_number=normalized_phone_number,
+            status=(
+                MessageStatus.PENDING
+                if normalized_phone_number is not None
+                else MessageStatus.NOT_VALID_PHONE_NUMBER
+            ),
+            row_number=row_number,
+        )
+        for row_number, user_id, phone_number, normalized_phone_number in zip(
+            range(first_row_number, first_row_number + len(rows)),
+            ids.tolist(),
+            phone_numbers.tolist(),
+            normalized_phone_numbers.tolist(),
+        )
+    ]
@@ -32,6 +32,7 @@ class ServiceManager:
             my_sql_connection_pool=my_sql_connection_pool,
             mongo_db_connection=mongo_db_connection,
         )
+        await self._notify_service.warm_up()
 
     async def create_user_service(
         self,
@@ -61,6 +62,12 @@ class ServiceManager:
                 use_sso=settings.USE_SSO,
                 bot_token=settings.TELEGRAM_BOT_TOKEN,
                 billing_group_chat_id=settings.BILLING_MESSAGES_TELEGRAM_ID,
+                telegram_config=settings.TELEGRAM_CONFIG,
+                celery_broker_url=settings.CELERY_BROKER_URL,
+                notify_chunk_size=settings.NOTIFY_CHUNK_SIZE,
+                notify_checkpoint_size=settings.NOTIFY_CHECKPOINT_SIZE,
+                notify_retry_config=settings.NOTIFY_RETRY_CONFIG,
+                notify_upload_max_size=settings.NOTIFY_UPLOAD_MAX_SIZE,
             )
         return self._notify_service
 
@@ -78,6 +85,10 @@ class ServiceManager:
             )
         return self._telegram_service
 
+    async def close(self) -> None:
+        if self._notify_service is not None:
+            await self._notify_service.close()
+
 
 service_manager = ServiceManager()
 
@@ -94,6 +105,10 @@ async def init_service_manager(
     )
 
 
+async def close_service_manager():
+    await service_manager.close()
+
+
 MySqlConnectionPool = Annotated[Pool, Depends(get_my_sql_db_conn_pool)]
 MongoConnection = Annotated[Connection, Depends(get_mongo_conn)]
 
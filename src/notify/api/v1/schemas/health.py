@@ -0,0 +1,20 @@
+from pydantic import BaseModel
+
+from src.notify.helpers.circuit_breaker import CircuitBreakerState
+
+
+class CircuitBreakerStateSchema(BaseModel):
+    name: str
+    state: CircuitBreakerState
+    is_open: bool
+    calls: int
+    failure_rate: float
+    slow_call_rate: float
+    opened_count: int
+    open_for: float | None
+    instances: int = 1
+
+
+class HealthResponseSchema(BaseModel):
+    status: str
+    circuit_breakers: list[CircuitBreakerStateSchema]
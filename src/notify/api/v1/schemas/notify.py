@@ -1,7 +1,11 @@
+from uuid import UUID
+
 from pydantic import BaseModel
 
+from src.notify.adapters.models.message import MessageStatus
 from src.notify.adapters.models.notify import Notify
 from src.notify.api.v1.schemas.base import BaseQuery
+from src.notify.helpers.sms_segments import SMSEncoding
 
 
 class NotifyListResponseSchema(BaseModel):
@@ -12,3 +16,26 @@ class NotifyListResponseSchema(BaseModel):
 class NotifyQueryParams(BaseQuery):
     username: str | None = None
     ordering: str = "-notify_date"
+
+
+class NotifyJobResponseSchema(BaseModel):
+    job_id: UUID
+
+
+class NotifyJobStatusResponseSchema(BaseModel):
+    notify: Notify
+    statuses: dict[MessageStatus, int]
+
+
+class DeadLettersReplayResponseSchema(BaseModel):
+    replayed_count: int
+
+
+class SMSPreviewResponseSchema(BaseModel):
+    encoding: SMSEncoding
+    length: int
+    segments: int
+    recipients: int
+    total_segments: int
+    estimated_cost: float
+    balance: float | None
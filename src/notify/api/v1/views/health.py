@@ -0,0 +1,24 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Depends
+from starlette import status
+
+from src.notify.adapters.services.notify_service import NotifyService
+from src.notify.api.dependencies.services import get_notify_service
+from src.notify.api.v1.schemas.health import HealthResponseSchema
+
+health_router = APIRouter(
+    prefix="/health",
+    tags=["health"],
+)
+
+NotifyService = Annotated[NotifyService, Depends(get_notify_service)]
+
+
+@health_router.get(
+    "/",
+    response_model=HealthResponseSchema,
+    status_code=status.HTTP_200_OK,
+)
+async def get_health(notify_service: NotifyService):
+    return await notify_service.get_providers_health()
@@ -10,7 +10,14 @@ from src.notify.adapters.services.notify_service import NotifyService
 from src.notify.adapters.services.user_service import UserService
 from src.notify.api.dependencies.auth import authorization_user
 from src.notify.api.dependencies.services import get_notify_service, get_user_service
-from src.notify.api.v1.schemas.notify import NotifyListResponseSchema, NotifyQueryParams
+from src.notify.api.v1.schemas.notify import (
+    DeadLettersReplayResponseSchema,
+    NotifyJobResponseSchema,
+    NotifyJobStatusResponseSchema,
+    NotifyListResponseSchema,
+    NotifyQueryParams,
+    SMSPreviewResponseSchema,
+)
 from src.notify.api.v1.schemas.users_schemas import (
     BillingFiltersResponseSchema,
     QueryUserNotifySchema,
@@ -78,49 +85,134 @@ async def get_user_list(
 
 
 @notifies_router.post(
-    "/send_sms_by_file/",
+    "/sms_preview/",
+    response_model=SMSPreviewResponseSchema,
     status_code=status.HTTP_200_OK,
 )
+async def get_sms_preview(
+    request: Request,
+    notify_service: NotifyService,
+    message: str,
+    sms_file: Annotated[UploadFile | None, File(alias="sms_file")] = None,
+):
+    return await notify_service.get_sms_preview(message_text=message, sms_file=sms_file)
+
+
+@notifies_router.post(
+    "/send_sms_by_file/",
+    response_model=NotifyJobResponseSchema,
+    status_code=status.HTTP_202_ACCEPTED,
+)
 async def get_user_list(
     request: Request,
     notify_service: NotifyService,
     message: str,
     sms_file: Annotated[UploadFile, File(alias="sms_file")],
 ):
-    notify_report_file = await notify_service.send_sms_by_file(
+    notify = await notify_service.send_sms_by_file(
         sms_file=sms_file,
         message_text=message,
         user_uuid=request.state.user_uuid,
         username=request.state.username,
     )
-    return FileResponse(
-        notify_report_file,
-        filename=f"notify_report_file.csv",
-        media_type="text/csv",
-    )
+    return {"job_id": notify.uuid}
 
 
 @notifies_router.post(
     "/send_telegram_notify_by_file/",
-    status_code=status.HTTP_200_OK,
+    response_model=NotifyJobResponseSchema,
+    status_code=status.HTTP_202_ACCEPTED,
 )
 async def get_user_list(
     request: Request,
     notify_service: NotifyService,
     message: str,
     telegram_notify_file: Annotated[UploadFile, File(alias="telegram_notify_file")],
+    attachment: Annotated[UploadFile | None, File(alias="attachment")] = None,
 ):
-    notify_report_file = await notify_service.send_telegram_notify_by_file(
+    notify = await notify_service.send_telegram_notify_by_file(
         telegram_notify_file=telegram_notify_file,
         message_text=message,
         user_uuid=request.state.user_uuid,
         username=request.state.username,
+        attachment_file=attachment,
     )
-    return FileResponse(
-        notify_report_file,
-        filename=f"notify_report_file.csv",
-        media_type="text/csv",
+    return {"job_id": notify.uuid}
+
+
+@notifies_router.post(
+    "/send_multi_channel_notify_by_file/",
+    response_model=NotifyJobResponseSchema,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+async def send_multi_channel_notify_by_file(
+    request: Request,
+    notify_service: NotifyService,
+    message: str,
+    notify_file: Annotated[UploadFile, File(alias="notify_file")],
+):
+    notify = await notify_service.send_multi_channel_notify_by_file(
+        notify_file=notify_file,
+        message_text=message,
+        user_uuid=request.state.user_uuid,
+        username=request.state.username,
     )
+    return {"job_id": notify.uuid}
+
+
+@notifies_router.post(
+    "/resume/",
+    response_model=NotifyJobResponseSchema,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+async def resume_notify(
+    request: Request,
+    notify_uuid: UUID,
+    notify_service: NotifyService,
+):
+    notify = await notify_service.resume_notify(notify_uuid=notify_uuid)
+    return {"job_id": notify.uuid}
+
+
+@notifies_router.post(
+    "/cancel/",
+    response_model=NotifyJobResponseSchema,
+    status_code=status.HTTP_200_OK,
+)
+async def cancel_notify(
+    request: Request,
+    notify_uuid: UUID,
+    notify_service: NotifyService,
+):
+    notify = await notify_service.cancel_notify(notify_uuid=notify_uuid)
+    return {"job_id": notify.uuid}
+
+
+@notifies_router.post(
+    "/dead_letters/replay/",
+    response_model=DeadLettersReplayResponseSchema,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+async def replay_dead_letters(
+    request: Request,
+    notify_service: NotifyService,
+    notify_uuid: UUID | None = None,
+):
+    replayed_count = await notify_service.replay_dead_letters(notify_uuid=notify_uuid)
+    return {"replayed_count": replayed_count}
+
+
+@notifies_router.get(
+    "/job_status/",
+    response_model=NotifyJobStatusResponseSchema,
+    status_code=status.HTTP_200_OK,
+)
+async def get_notify_job_status(
+    request: Request,
+    notify_uuid: UUID,
+    notify_service: NotifyService,
+):
+    return await notify_service.get_notify_job_status(notify_uuid=notify_uuid)
 
 
 @notifies_router.get(
@@ -69,3 +69,7 @@ def register_events(app: FastAPI):
             ),
             mongo_db_connection=create_mongo_connection(db_url=settings.MONGO_DB_URL),
         )
+
+    @app.on_event("shutdown")
+    async def close_service_manager():
+        await services.close_service_manager()
@@ -0,0 +1,41 @@
+import logging
+from uuid import uuid4
+
+from src.notify.clients.sms_provider_client import SMSProviderClient, SMSSendResult
+
+logger = logging.getLogger(__name__)
+
+
+class LocalSMSClient(SMSProviderClient):
+    """Offline stand-in for TurboSMS: accepts every message and keeps it in memory."""
+
+    DELIVERED_STATUS = "Delivered"
+    BALANCE = 1_000_000.0
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.sent_messages: dict[str, tuple[str, str]] = {}
+
+    async def _send_sms(
+        self, phone_numbers: list[str], text: str
+    ) -> dict[str, SMSSendResult]:
+        results = {}
+        for phone_number in phone_numbers:
+            message_id = str(uuid4())
+            self.sent_messages[message_id] = (phone_number, text)
+            results[phone_number] = SMSSendResult(ok=True, message_id=message_id)
+        logger.info("LocalSMSClient: %s SMS accepted", len(phone_numbers))
+        return results
+
+    async def _get_messages_statuses(
+        self, message_ids: list[str]
+    ) -> dict[str, str | None]:
+        return {
+            message_id: (
+                self.DELIVERED_STATUS if message_id in self.sent_messages else None
+            )
+            for message_id in message_ids
+        }
+
+    async def _get_current_balance(self) -> float:
+        return self.BALANCE
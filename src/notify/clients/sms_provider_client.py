@@ -0,0 +1,140 @@
+import logging
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from time import monotonic
+
+import httpx
+
+from src.notify.config import TurboSMSConfig
+from src.notify.helpers.circuit_breaker import (
+    CircuitBreaker,
+    RedisCircuitBreakerStateStore,
+)
+from src.notify.helpers.rate_limit import RedisTokenBucket, TokenBucket
+
+logger = logging.getLogger(__name__)
+
+
+class SMSProviderUnavailable(Exception):
+    pass
+
+
+@dataclass
+class SMSSendResult:
+    ok: bool
+    description: str | None = None
+    circuit_open: bool = False
+    transient: bool = False
+    message_id: str | None = None
+    error_code: int | None = None
+
+
+class SMSProviderClient(ABC):
+    def __init__(
+        self,
+        turbo_sms_config: TurboSMSConfig,
+        sender: str,
+        use_sso: bool,
+        rate_limiter: TokenBucket | RedisTokenBucket,
+        circuit_breaker_state_store: RedisCircuitBreakerStateStore | None = None,
+    ):
+        self.turbo_sms_config = turbo_sms_config
+        self.sender = sender
+        self.use_sso = use_sso
+        self.rate_limiter = rate_limiter
+        self.circuit_breaker = CircuitBreaker(
+            name="turbo_sms",
+            config=turbo_sms_config.circuit_breaker,
+            state_store=circuit_breaker_state_store,
+        )
+
+    async def warm_up(self) -> None:
+        pass
+
+    async def close(self) -> None:
+        await self.rate_limiter.close()
+        await self.circuit_breaker.close()
+
+    @abstractmethod
+    async def _send_sms(
+        self, phone_numbers: list[str], text: str
+    ) -> dict[str, SMSSendResult]:
+        ...
+
+    @abstractmethod
+    async def _get_messages_statuses(
+        self, message_ids: list[str]
+    ) -> dict[str, str | None]:
+        ...
+
+    @abstractmethod
+    async def _get_current_balance(self) -> float:
+        ...
+
+    @staticmethod
+    def _get_error_code(error: Exception) -> int | None:
+        if isinstance(error, httpx.HTTPStatusError):
+            return error.response.status_code
+        return None
+
+    @classmethod
+    def _is_transient_error(cls, error: Exception) -> bool:
+        error_code = cls._get_error_code(error)
+        if error_code is not None:
+            return error_code == 429 or error_code >= 500
+        return isinstance(error, (httpx.TransportError, TimeoutError))
+
+    async def send_sms(
+        self, phone_numbers: list[str], text: str
+    ) -> dict[str, SMSSendResult]:
+        if self.use_sso is False:
+            return {
+                phone_number: SMSSendResult(ok=True) for phone_number in phone_numbers
+            }
+        if not self.circuit_breaker.allow_request():
+            result = SMSSendResult(
+                ok=False, description="TurboSMS is unavailable", circuit_open=True
+            )
+            return {phone_number: result for phone_number in phone_numbers}
+        try:
+            await self.rate_limiter.acquire()
+            started_at = monotonic()
+            results = await self._send_sms(phone_numbers=phone_numbers, text=text)
+            self.circuit_breaker.record_success(duration=monotonic() - started_at)
+        except Exception as e:
+            self.circuit_breaker.record_failure()
+            await self.circuit_breaker.publish()
+            logger.exception(
+                "TurboSMSService. Unexpected exception during SMS sending %s",
+                ",".join(phone_numbers),
+            )
+            result = SMSSendResult(
+                ok=False,
+                description=str(e),
+                transient=self._is_transient_error(e),
+                error_code=self._get_error_code(e),
+            )
+            return {phone_number: result for phone_number in phone_numbers}
+        await self.circuit_breaker.publish()
+        return results
+
+    async def get_messages_statuses(
+        self, message_ids: list[str]
+    ) -> dict[str, str | None]:
+        if self.use_sso is False or not message_ids:
+            return {message_id: None for message_id in message_ids}
+        return await self._get_messages_statuses(message_ids=message_ids)
+
+    async def get_current_balance(self) -> float:
+        if not self.circuit_breaker.allow_request():
+            raise SMSProviderUnavailable("TurboSMS is unavailable")
+        started_at = monotonic()
+        try:
+            balance = await self._get_current_balance()
+        except Exception:
+            self.circuit_breaker.record_failure()
+            await self.circuit_breaker.publish()
+            raise
+        self.circuit_breaker.record_success(duration=monotonic() - started_at)
+        await self.circuit_breaker.publish()
+        return balance
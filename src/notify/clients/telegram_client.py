@@ -1,26 +1,202 @@
 import logging
+from dataclasses import dataclass
+from time import monotonic
 
-from httpx import HTTPError, post
+import httpx
+from httpx import HTTPError
+
+from src.notify.config import TelegramConfig
+from src.notify.helpers.circuit_breaker import (
+    CircuitBreaker,
+    RedisCircuitBreakerStateStore,
+)
+from src.notify.helpers.rate_limit import (
+    RedisTokenBucket,
+    TokenBucket,
+    create_token_bucket,
+)
 
 logger = logging.getLogger(__name__)
 
 
+def create_telegram_rate_limiter(
+    rate_limit_url: str | None, bot_token: str, telegram_config: TelegramConfig
+) -> TokenBucket | RedisTokenBucket:
+    bot_id = bot_token.split(":", 1)[0]
+    return create_token_bucket(
+        redis_url=rate_limit_url,
+        key=f"rate_limit:telegram:{bot_id}",
+        rate=telegram_config.messages_per_second,
+    )
+
+
+@dataclass
+class TelegramSendResult:
+    chat_id: int
+    ok: bool
+    error_code: int | None = None
+    description: str | None = None
+    retry_after: float | None = None
+    file_id: str | None = None
+    circuit_open: bool = False
+
+    @property
+    def is_transient(self) -> bool:
+        return (
+            not self.ok
+            and not self.circuit_open
+            and (
+                self.error_code is None
+                or self.error_code == 429
+                or self.error_code >= 500
+            )
+        )
+
+    @property
+    def is_chat_unreachable(self) -> bool:
+        return self.error_code == 403 or (
+            self.error_code == 400 and "chat not found" in (self.description or "")
+        )
+
+
+@dataclass
+class TelegramMedia:
+    media_type: str
+    filename: str
+    content_type: str
+    content: bytes | None = None
+    file_id: str | None = None
+
+
 class TelegramClient:
     TELEGRAM_URL = "https://api.telegram.org/"
+    MEDIA_METHODS = {"photo": "sendPhoto", "document": "sendDocument"}
 
-    def __init__(self, telegram_bot_token: str, use_sso: bool = False):
+    _client: httpx.AsyncClient | None = None
+
+    def __init__(
+        self,
+        telegram_bot_token: str,
+        telegram_config: TelegramConfig,
+        rate_limiter: TokenBucket | RedisTokenBucket,
+        use_sso: bool = False,
+        circuit_breaker_state_store: RedisCircuitBreakerStateStore | None = None,
+    ):
         self.telegram_bot_token = telegram_bot_token
+        self.telegram_config = telegram_config
+        self.rate_limiter = rate_limiter
         self.use_sso = use_sso
+        self.circuit_breaker = CircuitBreaker(
+            name="telegram",
+            config=telegram_config.circuit_breaker,
+            state_store=circuit_breaker_state_store,
+        )
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                base_url=self.TELEGRAM_URL + f"bot{self.telegram_bot_token}/",
+                timeout=httpx.Timeout(
+                    self.telegram_config.timeout,
+                    connect=self.telegram_config.connect_timeout,
+                ),
+                limits=httpx.Limits(
+                    max_connections=self.telegram_config.max_connections,
+                    max_keepalive_connections=(
+                        self.telegram_config.max_keepalive_connections
+                    ),
+                    keepalive_expiry=self.telegram_config.keepalive_expiry,
+                ),
+            )
+        return self._client
 
-    async def send_message(self, chat_id: int, text: str) -> bool:
+    async def close(self) -> None:
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+        self._client = None
+        await self.rate_limiter.close()
+        await self.circuit_breaker.close()
+
+    async def send_message(self, chat_id: int, text: str) -> TelegramSendResult:
         # if not self.use_sso:
-        #     return True
+        #     return TelegramSendResult(chat_id=chat_id, ok=True)
+        return await self._post(
+            chat_id=chat_id,
+            method="sendMessage",
+            json={"chat_id": chat_id, "text": text},
+        )
+
+    async def send_media(
+        self, chat_id: int, media: TelegramMedia, caption: str
+    ) -> TelegramSendResult:
+        method = self.MEDIA_METHODS[media.media_type]
+        if media.file_id is not None:
+            return await self._post(
+                chat_id=chat_id,
+                method=method,
+                json={
+                    "chat_id": chat_id,
+                    "caption": caption,
+                    media.media_type: media.file_id,
+                },
+            )
+        return await self._post(
+            chat_id=chat_id,
+            method=method,
+            data={"chat_id": chat_id, "caption": caption},
+            files={
+                media.media_type: (media.filename, media.content, media.content_type)
+            },
+        )
+
+    async def _post(self, chat_id: int, method: str, **kwargs) -> TelegramSendResult:
+        if not self.circuit_breaker.allow_request():
+            return TelegramSendResult(
+                chat_id=chat_id,
+                ok=False,
+                description="Telegram API is unavailable",
+                circuit_open=True,
+            )
+        await self.rate_limiter.acquire()
+        started_at = monotonic()
         try:
-            post(
-                self.TELEGRAM_URL + f"bot{self.telegram_bot_token}/sendMessage",
-                params={"chat_id": chat_id, "text": text},
+            response = await self.client.post(method, **kwargs)
+            data = response.json()
+        except (HTTPError, ValueError) as e:
+            logger.error(e)
+            self.circuit_breaker.record_failure()
+            await self.circuit_breaker.publish()
+            return TelegramSendResult(chat_id=chat_id, ok=False, description=str(e))
+        if response.status_code >= 500:
+            self.circuit_breaker.record_failure()
+        else:
+            self.circuit_breaker.record_success(duration=monotonic() - started_at)
+        await self.circuit_breaker.publish()
+        if data.get("ok") is True:
+            return TelegramSendResult(
+                chat_id=chat_id, ok=True, file_id=self._get_file_id(data["result"])
             )
-        except HTTPError as e:
-            logging.error(e)
-            return False
-        return True
+        logger.warning(
+            "TelegramClient: Message sending error %s, %s",
+            chat_id,
+            data.get("description"),
+        )
+        result = TelegramSendResult(
+            chat_id=chat_id,
+            ok=False,
+            error_code=data.get("error_code", response.status_code),
+            description=data.get("description"),
+            retry_after=data.get("parameters", {}).get("retry_after"),
+        )
+        if result.retry_after is not None:
+            await self.rate_limiter.pause(result.retry_after)
+        return result
+
+    @staticmethod
+    def _get_file_id(result: dict) -> str | None:
+        if result.get("photo"):
+            return result["photo"][-1]["file_id"]
+        if result.get("document"):
+            return result["document"]["file_id"]
+        return None
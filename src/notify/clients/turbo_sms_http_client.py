@@ -0,0 +1,125 @@
+import logging
+
+import httpx
+
+from src.notify.clients.sms_provider_client import SMSProviderClient, SMSSendResult
+
+logger = logging.getLogger(__name__)
+
+
+class TurboSMSHTTPClient(SMSProviderClient):
+    SUCCESS_CODES = frozenset({0, *range(800, 900)})
+
+    _client: httpx.AsyncClient | None = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                base_url=self.turbo_sms_config.api_url,
+                headers={"Authorization": f"Bearer {self.turbo_sms_config.api_token}"},
+                timeout=httpx.Timeout(
+                    self.turbo_sms_config.timeout,
+                    connect=self.turbo_sms_config.connect_timeout,
+                ),
+                limits=httpx.Limits(
+                    max_connections=self.turbo_sms_config.max_connections,
+                    max_keepalive_connections=(
+                        self.turbo_sms_config.max_keepalive_connections
+                    ),
+                    keepalive_expiry=self.turbo_sms_config.keepalive_expiry,
+                ),
+            )
+        return self._client
+
+    async def close(self) -> None:
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+        self._client = None
+        await super().close()
+
+    async def _post(self, method: str, json: dict | None = None) -> dict:
+        response = await self.client.post(method, json=json or {})
+        response.raise_for_status()
+        return response.json()
+
+    async def _send_sms(
+        self, phone_numbers: list[str], text: str
+    ) -> dict[str, SMSSendResult]:
+        data = await self._post(
+            "message/send.json",
+            json={
+                "recipients": [
+                    phone_number.lstrip("+") for phone_number in phone_numbers
+                ],
+                "sms": {"sender": self.sender, "text": text},
+            },
+        )
+        return self._get_send_results(phone_numbers=phone_numbers, data=data)
+
+    def _get_send_results(
+        self, phone_numbers: list[str], data: dict
+    ) -> dict[str, SMSSendResult]:
+        entries = data.get("response_result")
+        if data.get("response_code") not in self.SUCCESS_CODES or not isinstance(
+            entries, list
+        ):
+            logger.warning("TurboSMSService: Message sending error %s", data)
+            result = SMSSendResult(
+                ok=False,
+                description=data.get("response_status"),
+                error_code=data.get("response_code"),
+            )
+            return {phone_number: result for phone_number in phone_numbers}
+        entries = {str(entry.get("phone")).lstrip("+"): entry for entry in entries}
+        results = {}
+        for phone_number in phone_numbers:
+            entry = entries.get(phone_number.lstrip("+"), {})
+            if entry.get("message_id") and (
+                entry.get("response_code") in self.SUCCESS_CODES
+            ):
+                results[phone_number] = SMSSendResult(
+                    ok=True, message_id=entry["message_id"]
+                )
+            else:
+                logger.warning(
+                    "TurboSMSService: Message sending error %s, %s",
+                    phone_number,
+                    entry.get("response_status"),
+                )
+                results[phone_number] = SMSSendResult(
+                    ok=False,
+                    description=entry.get("response_status"),
+                    error_code=entry.get("response_code"),
+                )
+        return results
+
+    async def _get_messages_statuses(
+        self, message_ids: list[str]
+    ) -> dict[str, str | None]:
+        statuses = {message_id: None for message_id in message_ids}
+        limit = self.turbo_sms_config.max_recipients_per_request
+        for offset in range(0, len(message_ids), limit):
+            chunk = message_ids[offset : offset + limit]
+            try:
+                await self.rate_limiter.acquire()
+                data = await self._post("message/status.json", json={"messages": chunk})
+            except Exception:
+                logger.exception(
+                    "TurboSMSService. Unexpected exception during message status"
+                )
+                continue
+            for entry in data.get("response_result") or []:
+                if entry.get("message_id") in statuses and entry.get("status"):
+                    statuses[entry["message_id"]] = str(entry["status"])
+        return statuses
+
+    async def _get_current_balance(self) -> float:
+        try:
+            data = await self._post("user/balance.json")
+            return float(data["response_result"]["balance"])
+        except Exception as e:
+            logger.exception(
+                "TurboSMSService. Unexpected exception during balance request",
+            )
+            raise e
@@ -1,70 +1,207 @@
+import asyncio
 import logging
+from time import monotonic
 
 import httpx
-from zeep.cache import InMemoryCache
+from zeep.cache import SqliteCache
 from zeep.client import AsyncClient
 from zeep.client import Client as ZeepClient
+from zeep.exceptions import TransportError
 from zeep.transports import AsyncTransport
 
+from src.notify.clients.sms_provider_client import SMSProviderClient, SMSSendResult
 from src.notify.config import TurboSMSConfig
+from src.notify.helpers.circuit_breaker import RedisCircuitBreakerStateStore
+from src.notify.helpers.rate_limit import RedisTokenBucket, TokenBucket
 
 logger = logging.getLogger(__name__)
 
 
-class TurboSMSClient:
+class TurboSMSClient(SMSProviderClient):
+    SEND_SUCCESS = "Сообщения успешно отправлены"
+    AUTH_SUCCESS = "Вы успешно авторизировались"
+    AUTH_REJECTED = ("Вы не авторизированы", "Не пройдена авторизация")
+
     _client: AsyncClient | None = None
+    _async_client: httpx.AsyncClient | None = None
+    _wsdl_client: httpx.Client | None = None
+    _session_expires_at: float = 0.0
     wsdl: str = ""
     login: str = ""
     password: str = ""
 
-    def __init__(self, turbo_sms_config: TurboSMSConfig, sender: str, use_sso: bool):
+    def __init__(
+        self,
+        turbo_sms_config: TurboSMSConfig,
+        sender: str,
+        use_sso: bool,
+        rate_limiter: TokenBucket | RedisTokenBucket,
+        circuit_breaker_state_store: RedisCircuitBreakerStateStore | None = None,
+    ):
+        super().__init__(
+            turbo_sms_config=turbo_sms_config,
+            sender=sender,
+            use_sso=use_sso,
+            rate_limiter=rate_limiter,
+            circuit_breaker_state_store=circuit_breaker_state_store,
+        )
         self.wsdl = turbo_sms_config.wsdl
         self.login = turbo_sms_config.login
         self.password = turbo_sms_config.password
-        self.sender = sender
-        self.use_sso = use_sso
+        self._auth_lock = asyncio.Lock()
 
     @property
     def client(self) -> ZeepClient:
         if self._client is None:
-            async_client = httpx.AsyncClient()
-            wsdl_client = httpx.Client()
+            timeout = httpx.Timeout(
+                self.turbo_sms_config.timeout,
+                connect=self.turbo_sms_config.connect_timeout,
+            )
+            if self._async_client is None:
+                self._async_client = httpx.AsyncClient(
+                    timeout=timeout,
+                    limits=httpx.Limits(
+                        max_connections=self.turbo_sms_config.max_connections,
+                        max_keepalive_connections=(
+                            self.turbo_sms_config.max_keepalive_connections
+                        ),
+                        keepalive_expiry=self.turbo_sms_config.keepalive_expiry,
+                    ),
+                )
+            if self._wsdl_client is None:
+                self._wsdl_client = httpx.Client(timeout=timeout)
             transport = AsyncTransport(
-                cache=InMemoryCache(),
-                timeout=5,
-                client=async_client,
-                wsdl_client=wsdl_client,
+                cache=SqliteCache(
+                    path=self.turbo_sms_config.wsdl_cache_path,
+                    timeout=self.turbo_sms_config.wsdl_cache_timeout,
+                ),
+                client=self._async_client,
+                wsdl_client=self._wsdl_client,
             )
             self._client = AsyncClient(self.wsdl, transport=transport)
 
         return self._client
 
-    async def send_sms(self, destination: str, text: str) -> bool:
-        ok = True
+    async def warm_up(self) -> None:
         if self.use_sso is False:
-            return ok
+            return
+        # Building the zeep client loads and parses the WSDL synchronously.
         try:
-            await self.client.service.Auth(login=self.login, password=self.password)
-            res = await self.client.service.SendSMS(
-                sender=self.sender, destination=destination, text=text
+            await asyncio.to_thread(lambda: self.client)
+        except Exception:
+            logger.exception("TurboSMSService. WSDL loading error")
+
+    async def close(self) -> None:
+        if self._async_client is not None:
+            await self._async_client.aclose()
+        if self._wsdl_client is not None:
+            self._wsdl_client.close()
+        self._client = None
+        self._async_client = None
+        self._wsdl_client = None
+        self._session_expires_at = 0.0
+        await super().close()
+
+    async def _authenticate(self) -> None:
+        async with self._auth_lock:
+            if monotonic() < self._session_expires_at:
+                return
+            res = await self.client.service.Auth(
+                login=self.login, password=self.password
             )
-            if "Сообщения успешно отправлены" not in res:
+            if self.AUTH_SUCCESS not in str(res):
+                logger.warning("TurboSMSService: Authentication error %s", res)
+                return
+            self._session_expires_at = monotonic() + self.turbo_sms_config.session_ttl
+
+    def _is_auth_rejected(self, res) -> bool:
+        return any(marker in str(res) for marker in self.AUTH_REJECTED)
+
+    async def _call(self, operation: str, **kwargs):
+        for _ in range(2):
+            await self._authenticate()
+            res = await getattr(self.client.service, operation)(**kwargs)
+            if not self._is_auth_rejected(res):
+                self._session_expires_at = (
+                    monotonic() + self.turbo_sms_config.session_ttl
+                )
+                return res
+            logger.info("TurboSMSService: Session expired, re-authenticating")
+            self._session_expires_at = 0.0
+        return res
+
+    async def _send_sms(
+        self, phone_numbers: list[str], text: str
+    ) -> dict[str, SMSSendResult]:
+        res = await self._call(
+            "SendSMS",
+            sender=self.sender,
+            destination=",".join(phone_numbers),
+            text=text,
+        )
+        return self._get_send_results(phone_numbers=phone_numbers, res=res)
+
+    def _get_send_results(
+        self, phone_numbers: list[str], res: list[str] | None
+    ) -> dict[str, SMSSendResult]:
+        # SendSMS returns the overall status followed by one entry per
+        # destination: the message id or an error for that number.
+        res = list(res or [])
+        if not res or self.SEND_SUCCESS not in res[0]:
+            logger.warning("TurboSMSService: Message sending error %s", res)
+            result = SMSSendResult(ok=False, description=str(res))
+            return {phone_number: result for phone_number in phone_numbers}
+        if len(res) != len(phone_numbers) + 1:
+            return {
+                phone_number: SMSSendResult(ok=True) for phone_number in phone_numbers
+            }
+        results = {}
+        for phone_number, entry in zip(phone_numbers, res[1:]):
+            if entry and " " not in entry:
+                results[phone_number] = SMSSendResult(ok=True, message_id=entry)
+            else:
                 logger.warning(
-                    "TurboSMSService: Message sending error %s, %s", destination, text
+                    "TurboSMSService: Message sending error %s, %s", phone_number, entry
                 )
-                ok = False
+                results[phone_number] = SMSSendResult(ok=False, description=entry)
+        return results
+
+    @staticmethod
+    def _get_error_code(error: Exception) -> int | None:
+        if isinstance(error, TransportError):
+            return error.status_code
+        return SMSProviderClient._get_error_code(error)
+
+    async def _get_message_status(self, message_id: str) -> str | None:
+        try:
+            await self.rate_limiter.acquire()
+            res = await self._call("GetMessageStatus", MessageId=message_id)
         except Exception:
-            ok = False
             logger.exception(
-                "TurboSMSService. Unexpected exception during SMS sending. Receiver: %s",
-                destination,
+                "TurboSMSService. Unexpected exception during GetMessageStatus %s",
+                message_id,
             )
-        return ok
+            return None
+        return str(res) if res is not None else None
+
+    async def _get_messages_statuses(
+        self, message_ids: list[str]
+    ) -> dict[str, str | None]:
+        # GetMessageStatus accepts a single id, so ids are polled concurrently.
+        in_flight = asyncio.Semaphore(self.turbo_sms_config.max_concurrent_requests)
+
+        async def get_status(message_id: str) -> str | None:
+            async with in_flight:
+                return await self._get_message_status(message_id=message_id)
+
+        statuses = await asyncio.gather(
+            *[get_status(message_id) for message_id in message_ids]
+        )
+        return dict(zip(message_ids, statuses))
 
-    async def get_current_balance(self) -> float:
+    async def _get_current_balance(self) -> float:
         try:
-            await self.client.service.Auth(login=self.login, password=self.password)
-            res = await self.client.service.GetCreditBalance()
+            res = float(await self._call("GetCreditBalance"))
         except Exception as e:
             logger.exception(
                 "TurboSMSService. Unexpected exception during GetCreditBalance",
@@ -1,14 +1,72 @@
+from enum import StrEnum
 from functools import lru_cache
 from os.path import abspath, dirname, join
 from typing import Sequence
 
+from pydantic import BaseModel
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
+class CircuitBreakerConfig(BaseModel):
+    window_size: int = 20
+    min_calls: int = 10
+    failure_rate_threshold: float = 0.5
+    slow_call_rate_threshold: float = 0.8
+    slow_call_duration: float = 5.0
+    open_timeout: float = 30.0
+    half_open_max_calls: int = 3
+
+
+class TurboSMSProvider(StrEnum):
+    SOAP = "soap"
+    HTTP = "http"
+    LOCAL = "local"
+
+
 class TurboSMSConfig(BaseSettings):
-    wsdl: str
-    login: str
-    password: str
+    provider: TurboSMSProvider = TurboSMSProvider.SOAP
+    wsdl: str = "http://turbosms.in.ua/api/wsdl.html"
+    login: str = ""
+    password: str = ""
+    api_url: str = "https://api.turbosms.ua/"
+    api_token: str = ""
+    requests_per_second: float = 5.0
+    circuit_breaker: CircuitBreakerConfig = CircuitBreakerConfig()
+    timeout: float = 10.0
+    connect_timeout: float = 5.0
+    max_connections: int = 20
+    max_keepalive_connections: int = 10
+    keepalive_expiry: float = 30.0
+    session_ttl: float = 20 * 60
+    max_recipients_per_request: int = 100
+    max_concurrent_requests: int = 4
+    wsdl_cache_path: str | None = None
+    wsdl_cache_timeout: int = 24 * 60 * 60
+    balance_cache_ttl: float = 5 * 60
+    balance_refresh_after: float = 60
+    sms_segment_price: float = 1.0
+    duplicate_window: float = 24 * 60 * 60
+
+
+class TelegramConfig(BaseModel):
+    timeout: float = 10.0
+    connect_timeout: float = 5.0
+    max_connections: int = 100
+    max_keepalive_connections: int = 20
+    keepalive_expiry: float = 30.0
+    messages_per_second: float = 30.0
+    chat_message_interval: float = 1.0
+    max_in_flight: int = 30
+    max_retry_after_attempts: int = 3
+    group_messages_per_minute: int = 20
+    group_message_linger: float = 2.0
+    circuit_breaker: CircuitBreakerConfig = CircuitBreakerConfig(slow_call_duration=3.0)
+
+
+class NotifyRetryConfig(BaseModel):
+    max_attempts: int = 5
+    base_delay: float = 10.0
+    max_delay: float = 600.0
 
 
 class Settings(BaseSettings):
@@ -47,8 +105,13 @@ class Settings(BaseSettings):
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60
 
     TELEGRAM_BOT_TOKEN: str
+    TELEGRAM_CONFIG: TelegramConfig = TelegramConfig()
 
     CELERY_BROKER_URL: str
+    NOTIFY_CHUNK_SIZE: int = 500
+    NOTIFY_CHECKPOINT_SIZE: int = 50
+    NOTIFY_RETRY_CONFIG: NotifyRetryConfig = NotifyRetryConfig()
+    NOTIFY_UPLOAD_MAX_SIZE: int = 64 * 1024 * 1024
     BILLING_MESSAGES_TELEGRAM_ID: int
 
 
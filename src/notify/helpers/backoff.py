@@ -0,0 +1,6 @@
+import random
+
+
+def get_backoff_delay(attempt: int, base_delay: float, max_delay: float) -> float:
+    """Exponential backoff with full jitter for the given 1-based attempt."""
+    return random.uniform(0, min(max_delay, base_delay * 2 ** (attempt - 1)))
@@ -0,0 +1,230 @@
+import enum
+import json
+import logging
+from collections import deque
+from os import getpid
+from socket import gethostname
+from time import monotonic, time
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from src.notify.config import CircuitBreakerConfig
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitBreakerState(str, enum.Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class RedisCircuitBreakerStateStore:
+    KEY_PREFIX = "circuit_breaker"
+    REDIS_TIMEOUT = 1.0
+    STATE_TTL = 10 * 60
+
+    def __init__(self, redis_url: str):
+        self.redis = Redis.from_url(
+            redis_url,
+            socket_timeout=self.REDIS_TIMEOUT,
+            socket_connect_timeout=self.REDIS_TIMEOUT,
+        )
+        self.instance = f"{gethostname()}:{getpid()}"
+
+    async def save(self, state: dict) -> None:
+        key = f"{self.KEY_PREFIX}:{state['name']}"
+        await self.redis.hset(key, self.instance, json.dumps(state))
+        await self.redis.expire(key, self.STATE_TTL)
+
+    async def get_states(self, name: str) -> list[dict]:
+        key = f"{self.KEY_PREFIX}:{name}"
+        now = time()
+        states = []
+        stale_instances = []
+        for instance, value in (await self.redis.hgetall(key)).items():
+            state = json.loads(value)
+            if now - state["published_at"] > self.STATE_TTL:
+                stale_instances.append(instance)
+            elif instance.decode() != self.instance:
+                states.append(state)
+        if stale_instances:
+            await self.redis.hdel(key, *stale_instances)
+        return states
+
+    async def close(self) -> None:
+        await self.redis.aclose()
+
+
+def create_circuit_breaker_state_store(
+    redis_url: str | None,
+) -> RedisCircuitBreakerStateStore | None:
+    if redis_url and redis_url.startswith(("redis://", "rediss://", "unix://")):
+        return RedisCircuitBreakerStateStore(redis_url=redis_url)
+    return None
+
+
+class CircuitBreaker:
+    PUBLISH_INTERVAL = 5.0
+
+    def __init__(
+        self,
+        name: str,
+        config: CircuitBreakerConfig,
+        state_store: RedisCircuitBreakerStateStore | None = None,
+    ):
+        self.name = name
+        self.config = config
+        self.state_store = state_store
+        self._published_state: CircuitBreakerState | None = None
+        self._published_at = 0.0
+        self.state = CircuitBreakerState.CLOSED
+        self.opened_at: float | None = None
+        self.opened_count = 0
+        self._calls: deque[tuple[bool, bool]] = deque(maxlen=config.window_size)
+        self._half_open_calls = 0
+        self._half_open_successes = 0
+
+    def _set_state(self, state: CircuitBreakerState) -> None:
+        if state == self.state:
+            return
+        logger.warning(
+            "Circuit breaker %s: %s -> %s", self.name, self.state.value, state.value
+        )
+        self.state = state
+        self._half_open_calls = 0
+        self._half_open_successes = 0
+        if state == CircuitBreakerState.OPEN:
+            self.opened_at = monotonic()
+            self.opened_count += 1
+        else:
+            self.opened_at = None
+        if state == CircuitBreakerState.CLOSED:
+            self._calls.clear()
+
+    def _get_rates(self) -> tuple[float, float]:
+        if not self._calls:
+            return 0.0, 0.0
+        failures = sum(1 for failed, _ in self._calls if failed)
+        slow_calls = sum(1 for _, slow in self._calls if slow)
+        return failures / len(self._calls), slow_calls / len(self._calls)
+
+    def allow_request(self) -> bool:
+        if self.state == CircuitBreakerState.OPEN:
+            if monotonic() - self.opened_at < self.config.open_timeout:
+                return False
+            self._set_state(CircuitBreakerState.HALF_OPEN)
+        if self.state == CircuitBreakerState.HALF_OPEN:
+            if self._half_open_calls >= self.config.half_open_max_calls:
+                return False
+            self._half_open_calls += 1
+        return True
+
+    @property
+    def is_open(self) -> bool:
+        if self.state == CircuitBreakerState.OPEN:
+            return monotonic() - self.opened_at < self.config.open_timeout
+        if self.state == CircuitBreakerState.HALF_OPEN:
+            return self._half_open_calls >= self.config.half_open_max_calls
+        return False
+
+    def record_success(self, duration: float) -> None:
+        self._record(failed=False, slow=duration >= self.config.slow_call_duration)
+
+    def record_failure(self) -> None:
+        self._record(failed=True, slow=False)
+
+    def _record(self, failed: bool, slow: bool) -> None:
+        if self.state == CircuitBreakerState.HALF_OPEN:
+            if failed or slow:
+                self._set_state(CircuitBreakerState.OPEN)
+                return
+            self._half_open_successes += 1
+            if self._half_open_successes >= self.config.half_open_max_calls:
+                self._set_state(CircuitBreakerState.CLOSED)
+            return
+        if self.state == CircuitBreakerState.OPEN:
+            return
+        self._calls.append((failed, slow))
+        if len(self._calls) < self.config.min_calls:
+            return
+        failure_rate, slow_call_rate = self._get_rates()
+        if (
+            failure_rate >= self.config.failure_rate_threshold
+            or slow_call_rate >= self.config.slow_call_rate_threshold
+        ):
+            self._set_state(CircuitBreakerState.OPEN)
+
+    def get_state(self) -> dict:
+        failure_rate, slow_call_rate = self._get_rates()
+        return {
+            "name": self.name,
+            "state": self.state,
+            "is_open": self.is_open,
+            "calls": len(self._calls),
+            "failure_rate": failure_rate,
+            "slow_call_rate": slow_call_rate,
+            "opened_count": self.opened_count,
+            "open_for": (
+                monotonic() - self.opened_at if self.opened_at is not None else None
+            ),
+        }
+
+    async def publish(self) -> None:
+        if self.state_store is None:
+            return
+        if (
+            self.state == self._published_state
+            and monotonic() - self._published_at < self.PUBLISH_INTERVAL
+        ):
+            return
+        self._published_state = self.state
+        self._published_at = monotonic()
+        state = self.get_state()
+        now = time()
+        state["published_at"] = now
+        state["open_timeout"] = self.config.open_timeout
+        state["opened_at"] = (
+            now - state["open_for"] if state["open_for"] is not None else None
+        )
+        try:
+            await self.state_store.save(state)
+        except RedisError as e:
+            logger.warning(
+                "Circuit breaker %s state publishing error: %s", self.name, e
+            )
+
+    @staticmethod
+    def _get_published_state(state: dict) -> dict:
+        if state["opened_at"] is not None:
+            state["open_for"] = time() - state["opened_at"]
+        if state["state"] == CircuitBreakerState.OPEN:
+            state["is_open"] = state["open_for"] < state["open_timeout"]
+        return state
+
+    async def get_shared_state(self) -> dict:
+        states = [self.get_state()]
+        if self.state_store is not None:
+            try:
+                states.extend(
+                    self._get_published_state(state)
+                    for state in await self.state_store.get_states(name=self.name)
+                )
+            except RedisError as e:
+                logger.warning(
+                    "Circuit breaker %s shared state error: %s", self.name, e
+                )
+        state = max(
+            states,
+            key=lambda state: (
+                state["is_open"],
+                state["state"] != CircuitBreakerState.CLOSED,
+                state["failure_rate"],
+            ),
+        )
+        return {**state, "instances": len(states)}
+
+    async def close(self) -> None:
+        if self.state_store is not None:
+            await self.state_store.close()
@@ -0,0 +1,61 @@
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable
+
+logger = logging.getLogger(__name__)
+
+
+class MessageCoalescer:
+    def __init__(
+        self,
+        send: Callable[[str], Awaitable[Any]],
+        max_length: int,
+        linger: float,
+        separator: str = "\n\n",
+    ):
+        self.send = send
+        self.max_length = max_length
+        self.linger = linger
+        self.separator = separator
+        self._buffer: list[str] = []
+        self._length = 0
+        self._linger_task: asyncio.Task | None = None
+
+    def _split(self, text: str) -> list[str]:
+        return [
+            text[offset : offset + self.max_length]
+            for offset in range(0, len(text), self.max_length)
+        ] or [text]
+
+    async def add(self, text: str) -> None:
+        for part in self._split(text):
+            length = self._length + len(self.separator) + len(part)
+            if self._buffer and length > self.max_length:
+                await self.flush()
+            self._length += (len(self.separator) if self._buffer else 0) + len(part)
+            self._buffer.append(part)
+        if self._length >= self.max_length:
+            await self.flush()
+        elif self._linger_task is None:
+            self._linger_task = asyncio.create_task(self._flush_after_linger())
+
+    async def _flush_after_linger(self) -> None:
+        await asyncio.sleep(self.linger)
+        self._linger_task = None
+        try:
+            await self.flush()
+        except Exception:
+            logger.exception("Coalesced message sending error")
+
+    async def flush(self) -> None:
+        if self._linger_task is not None and (
+            self._linger_task is not asyncio.current_task()
+        ):
+            self._linger_task.cancel()
+        self._linger_task = None
+        if not self._buffer:
+            return
+        text = self.separator.join(self._buffer)
+        self._buffer = []
+        self._length = 0
+        await self.send(text)
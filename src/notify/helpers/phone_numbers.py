@@ -0,0 +1,18 @@
+import phonenumbers
+from phonenumbers.phonenumberutil import NumberParseException
+
+DEFAULT_REGION = "UA"
+
+
+def normalize_phone_number(
+    phone_number: str | None, region: str = DEFAULT_REGION
+) -> str | None:
+    if not phone_number:
+        return None
+    try:
+        phone = phonenumbers.parse(phone_number, region)
+    except NumberParseException:
+        return None
+    if not phonenumbers.is_valid_number(phone):
+        return None
+    return phonenumbers.format_number(phone, phonenumbers.PhoneNumberFormat.E164)
@@ -0,0 +1,166 @@
+import asyncio
+import logging
+from time import monotonic
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+logger = logging.getLogger(__name__)
+
+REDIS_TOKEN_BUCKET_SCRIPT = """
+local rate = tonumber(ARGV[1])
+local capacity = tonumber(ARGV[2])
+local requested = tonumber(ARGV[3])
+local pause = tonumber(ARGV[4])
+local time = redis.call("TIME")
+local now = tonumber(time[1]) + tonumber(time[2]) / 1000000
+local state = redis.call("HMGET", KEYS[1], "tokens", "updated_at", "paused_until")
+local tokens = tonumber(state[1]) or capacity
+local updated_at = tonumber(state[2]) or now
+local paused_until = tonumber(state[3]) or 0
+local wait = 0
+if pause > 0 then
+    paused_until = math.max(paused_until, now + pause)
+    tokens = 0
+    updated_at = paused_until
+elseif now < paused_until then
+    wait = paused_until - now
+else
+    tokens = math.min(capacity, tokens + math.max(0, now - updated_at) * rate)
+    updated_at = math.max(now, updated_at)
+    if tokens >= requested then
+        tokens = tokens - requested
+    else
+        wait = (requested - tokens) / rate
+    end
+end
+redis.call(
+    "HSET", KEYS[1],
+    "tokens", tokens, "updated_at", updated_at, "paused_until", paused_until
+)
+redis.call(
+    "PEXPIRE", KEYS[1],
+    math.ceil((math.max(0, paused_until - now) + capacity / rate) * 1000) + 1000
+)
+return tostring(wait)
+"""
+
+
+class TokenBucket:
+    def __init__(self, rate: float, capacity: float | None = None):
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else rate
+        self._tokens = self.capacity
+        self._updated_at = monotonic()
+        self._paused_until = 0.0
+        self._lock = asyncio.Lock()
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(
+            self.capacity, self._tokens + (now - self._updated_at) * self.rate
+        )
+        self._updated_at = now
+
+    async def acquire(self, tokens: float = 1) -> None:
+        async with self._lock:
+            while True:
+                now = monotonic()
+                if now < self._paused_until:
+                    await asyncio.sleep(self._paused_until - now)
+                    continue
+                self._refill(now)
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+                await asyncio.sleep((tokens - self._tokens) / self.rate)
+
+    async def pause(self, seconds: float) -> None:
+        now = monotonic()
+        self._paused_until = max(self._paused_until, now + seconds)
+        self._tokens = 0
+        self._updated_at = max(now, self._paused_until)
+
+    async def close(self) -> None:
+        pass
+
+
+class RedisTokenBucket:
+    """Token bucket shared by every process that uses the same Redis key."""
+
+    REDIS_TIMEOUT = 1.0
+
+    def __init__(self, redis_url: str, key: str, rate: float, capacity: float):
+        self.key = key
+        self.rate = rate
+        self.capacity = capacity
+        self.redis = Redis.from_url(
+            redis_url,
+            socket_timeout=self.REDIS_TIMEOUT,
+            socket_connect_timeout=self.REDIS_TIMEOUT,
+        )
+        self.script = self.redis.register_script(REDIS_TOKEN_BUCKET_SCRIPT)
+        self.local_bucket = TokenBucket(rate=rate, capacity=capacity)
+
+    async def _call(self, tokens: float, pause: float) -> float:
+        return float(
+            await self.script(
+                keys=[self.key], args=[self.rate, self.capacity, tokens, pause]
+            )
+        )
+
+    async def acquire(self, tokens: float = 1) -> None:
+        while True:
+            try:
+                wait = await self._call(tokens=tokens, pause=0)
+            except RedisError as e:
+                logger.warning("Shared rate limiter %s is unavailable: %s", self.key, e)
+                await self.local_bucket.acquire(tokens)
+                return
+            if wait <= 0:
+                return
+            await asyncio.sleep(wait)
+
+    async def pause(self, seconds: float) -> None:
+        await self.local_bucket.pause(seconds)
+        try:
+            await self._call(tokens=0, pause=seconds)
+        except RedisError as e:
+            logger.warning("Shared rate limiter %s is unavailable: %s", self.key, e)
+
+    async def close(self) -> None:
+        await self.redis.aclose()
+
+
+def create_token_bucket(
+    redis_url: str | None, key: str, rate: float, capacity: float | None = None
+) -> TokenBucket | RedisTokenBucket:
+    capacity = capacity if capacity is not None else max(rate, 1)
+    if redis_url and redis_url.startswith(("redis://", "rediss://", "unix://")):
+        return RedisTokenBucket(
+            redis_url=redis_url, key=key, rate=rate, capacity=capacity
+        )
+    return TokenBucket(rate=rate, capacity=capacity)
+
+
+class KeyIntervalLimiter:
+    PRUNE_SIZE = 10000
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._next_allowed: dict[int | str, float] = {}
+
+    def _prune(self, now: float) -> None:
+        self._next_allowed = {
+            key: next_allowed
+            for key, next_allowed in self._next_allowed.items()
+            if next_allowed > now
+        }
+
+    async def acquire(self, key: int | str) -> None:
+        now = monotonic()
+        if len(self._next_allowed) > self.PRUNE_SIZE:
+            self._prune(now)
+        next_allowed = max(now, self._next_allowed.get(key, 0.0))
+        self._next_allowed[key] = next_allowed + self.interval
+        if next_allowed > now:
+            await asyncio.sleep(next_allowed - now)
@@ -0,0 +1,48 @@
+from dataclasses import dataclass
+from enum import StrEnum
+from math import ceil
+
+GSM_7_BASIC_CHARACTERS = frozenset(
+    "@£$¥èéùìòÇ\nØø\rÅåΔ_ΦΓΛΩΠΨΣΘΞÆæßÉ !\"#¤%&'()*+,-./0123456789:;<=>?"
+    "¡ABCDEFGHIJKLMNOPQRSTUVWXYZÄÖÑÜ§¿abcdefghijklmnopqrstuvwxyzäöñüà"
+)
+# Characters from the extension table take two septets (escape + character).
+GSM_7_EXTENSION_CHARACTERS = frozenset("^{}\\[~]|€\f")
+
+
+class SMSEncoding(StrEnum):
+    GSM_7 = "GSM-7"
+    UCS_2 = "UCS-2"
+
+
+@dataclass
+class SMSSegments:
+    encoding: SMSEncoding
+    length: int
+    segments: int
+
+
+SEGMENT_LENGTHS = {
+    SMSEncoding.GSM_7: (160, 153),
+    SMSEncoding.UCS_2: (70, 67),
+}
+
+
+def get_sms_segments(text: str) -> SMSSegments:
+    characters = set(text)
+    if characters <= GSM_7_BASIC_CHARACTERS | GSM_7_EXTENSION_CHARACTERS:
+        encoding = SMSEncoding.GSM_7
+        length = len(text) + sum(
+            1 for character in text if character in GSM_7_EXTENSION_CHARACTERS
+        )
+    else:
+        encoding = SMSEncoding.UCS_2
+        length = len(text.encode("utf-16-le")) // 2
+    single_length, multipart_length = SEGMENT_LENGTHS[encoding]
+    if length == 0:
+        segments = 0
+    elif length <= single_length:
+        segments = 1
+    else:
+        segments = ceil(length / multipart_length)
+    return SMSSegments(encoding=encoding, length=length, segments=segments)
@@ -5,6 +5,7 @@ from typing import Any, Callable
 
 from celery import Celery
 from celery.schedules import crontab
+from celery.signals import worker_process_shutdown
 
 from src.notify.adapters.services.notify_service import NotifyService
 from src.notify.adapters.services.telegram_service import TelegramService
@@ -15,6 +16,7 @@ from src.notify.extensions.db import (
     get_my_sql_db_connection_pool,
 )
 from src.notify.taskapp.service_manager import (
+    close_celery_service_manager,
     init_celery_service_manager,
     service_manager,
 )
@@ -36,7 +38,7 @@ _app = CeleryApp(__name__, broker=settings.CELERY_BROKER_URL)
 
 
 def create_celery_app():
-    task_modules = ["telegram_tasks"]
+    task_modules = ["telegram_tasks", "notify_tasks"]
     _app.autodiscover_tasks(
         [f"src.notify.taskapp.tasks.{task_module}" for task_module in task_modules]
     )
@@ -67,6 +69,11 @@ def create_celery_app():
     return _app
 
 
+@worker_process_shutdown.connect
+def close_celery_app(**kwargs) -> None:
+    get_event_loop().run_until_complete(close_celery_service_manager())
+
+
 def async_run_task(task) -> Callable[[tuple[Any, ...], dict[str, Any]], None]:
     @_app.task
     @wraps(task)
@@ -81,4 +88,12 @@ _app.conf.beat_schedule = {
         "task": "src.notify.taskapp.tasks.telegram_tasks.send_billing_messages_in_telegram",
         "schedule": crontab(minute="*/5"),
     },
+    "dispatch_notify_outbox": {
+        "task": "src.notify.taskapp.tasks.notify_tasks.dispatch_notify_outbox",
+        "schedule": crontab(minute="*"),
+    },
+    "poll_sms_delivery_statuses": {
+        "task": "src.notify.taskapp.tasks.notify_tasks.poll_sms_delivery_statuses",
+        "schedule": crontab(minute="*/5"),
+    },
 }
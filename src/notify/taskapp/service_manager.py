@@ -35,6 +35,7 @@ class ServiceManager:
             mongo_db_connection=self.mongo_db_connection,
             settings=self.settings,
         )
+        await self._notify_service.warm_up()
 
     async def _create_user_service(
         self,
@@ -88,6 +89,12 @@ class ServiceManager:
                 use_sso=settings.USE_SSO,
                 bot_token=settings.TELEGRAM_BOT_TOKEN,
                 billing_group_chat_id=settings.BILLING_MESSAGES_TELEGRAM_ID,
+                telegram_config=settings.TELEGRAM_CONFIG,
+                celery_broker_url=settings.CELERY_BROKER_URL,
+                notify_chunk_size=settings.NOTIFY_CHUNK_SIZE,
+                notify_checkpoint_size=settings.NOTIFY_CHECKPOINT_SIZE,
+                notify_retry_config=settings.NOTIFY_RETRY_CONFIG,
+                notify_upload_max_size=settings.NOTIFY_UPLOAD_MAX_SIZE,
             )
         return self._notify_service
 
@@ -105,6 +112,10 @@ class ServiceManager:
             )
         return self._telegram_service
 
+    async def close(self) -> None:
+        if self._notify_service is not None:
+            await self._notify_service.close()
+
 
 service_manager = ServiceManager()
 
@@ -119,3 +130,7 @@ async def init_celery_service_manager(
         my_sql_connection_pool=my_sql_connection_pool,
         mongo_db_connection=mongo_db_connection,
     )
+
+
+async def close_celery_service_manager():
+    await service_manager.close()
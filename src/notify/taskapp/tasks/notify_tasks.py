@@ -0,0 +1,20 @@
+from uuid import UUID
+
+from src.notify.taskapp.app import AppContext, async_run_task
+
+
+@async_run_task
+async def send_notify_chunk(ctx: AppContext, notify_uuid: str, chunk: int):
+    await ctx.notify_service.send_notify_chunk(
+        notify_uuid=UUID(notify_uuid), chunk=chunk
+    )
+
+
+@async_run_task
+async def dispatch_notify_outbox(ctx: AppContext):
+    await ctx.notify_service.dispatch_notify_outbox()
+
+
+@async_run_task
+async def poll_sms_delivery_statuses(ctx: AppContext):
+    await ctx.notify_service.poll_sms_delivery_statuses()
@@ -7,12 +7,14 @@ from aiogram.enums.parse_mode import ParseMode
 from aiogram.fsm.storage.memory import MemoryStorage
 from aiogram.types import TelegramObject
 
+from src.notify.clients.telegram_client import create_telegram_rate_limiter
 from src.notify.config import get_settings
 from src.notify.extensions.db import (
     create_mongo_connection,
     get_my_sql_db_connection_pool,
 )
 from src.notify.telegram_bot.dependency.services import (
+    close_telegram_bot_service_manager,
     init_telegram_bot_service_manager,
     service_manager,
 )
@@ -25,6 +27,7 @@ from src.notify.telegram_bot.handlers.payment import payment_router
 from src.notify.telegram_bot.handlers.repair_request import repair_request_router
 from src.notify.telegram_bot.handlers.start import start_router
 from src.notify.telegram_bot.handlers.tariffs import tariffs_router
+from src.notify.telegram_bot.middleware import RateLimitRequestMiddleware
 
 
 async def main():
@@ -47,6 +50,12 @@ async def main():
         token=settings.TELEGRAM_BOT_TOKEN,
         parse_mode=ParseMode.HTML,
     )
+    rate_limiter = create_telegram_rate_limiter(
+        rate_limit_url=settings.CELERY_BROKER_URL,
+        bot_token=settings.TELEGRAM_BOT_TOKEN,
+        telegram_config=settings.TELEGRAM_CONFIG,
+    )
+    bot.session.middleware(RateLimitRequestMiddleware(rate_limiter=rate_limiter))
     dp = Dispatcher(storage=MemoryStorage())
     dp.include_router(base_router)
     dp.include_router(contact_router)
@@ -68,4 +77,8 @@ async def main():
         return await handler(event, data)
 
     await bot.delete_webhook(drop_pending_updates=True)
-    await dp.start_polling(bot, allowed_updates=dp.resolve_used_update_types())
+    try:
+        await dp.start_polling(bot, allowed_updates=dp.resolve_used_update_types())
+    finally:
+        await close_telegram_bot_service_manager()
+        await rate_limiter.close()
@@ -0,0 +1,30 @@
+from aiogram import Bot
+from aiogram.client.session.middlewares.base import (
+    BaseRequestMiddleware,
+    NextRequestMiddlewareType,
+)
+from aiogram.exceptions import TelegramRetryAfter
+from aiogram.methods import GetUpdates, Response, TelegramMethod
+from aiogram.methods.base import TelegramType
+
+from src.notify.helpers.rate_limit import RedisTokenBucket, TokenBucket
+
+
+class RateLimitRequestMiddleware(BaseRequestMiddleware):
+    def __init__(self, rate_limiter: TokenBucket | RedisTokenBucket):
+        self.rate_limiter = rate_limiter
+
+    async def __call__(
+        self,
+        make_request: NextRequestMiddlewareType[TelegramType],
+        bot: Bot,
+        method: TelegramMethod[TelegramType],
+    ) -> Response[TelegramType]:
+        if isinstance(method, GetUpdates):
+            return await make_request(bot, method)
+        await self.rate_limiter.acquire()
+        try:
+            return await make_request(bot, method)
+        except TelegramRetryAfter as e:
+            await self.rate_limiter.pause(e.retry_after)
+            raise